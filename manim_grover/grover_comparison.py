@@ -1,5 +1,6 @@
 from manim import *
 import numpy as np
+from grover_data import load
 
 class BlochSphere(VGroup):
     def __init__(self, **kwargs):
@@ -48,28 +49,43 @@ class GroverComparison(ThreeDScene):
         self.set_camera_orientation(phi=75 * DEGREES, theta=-45 * DEGREES)
         bloch = BlochSphere()
         
-        # State vector (can be animated)
+        # Angles and amplitudes for GROVER_N / GROVER_M (grover_data.py)
+        data = load()
+        t_opt, angle = data["t_opt"], data["angle"]
+
+        # State vector (can be animated), starting at |u>, theta from |e>
         state_vector = Arrow3D(
             start=np.array([0., 0., 0.]),
             end=np.array([1., 0., 0.]),
             color=YELLOW
-        )
+        ).rotate(angle[0], axis=UP, about_point=ORIGIN)
+
+        # Amplitude on |e> and |a>: sqrt(|e|) and sqrt(|a|) times the per-state ones
+        def amplitudes(t):
+            return [np.sqrt(data["N"] - data["M"]) * data["amp_e"][t],
+                    np.sqrt(data["M"]) * data["amp_a"][t]]
+        bars = BarChart(amplitudes(0), bar_names=[r"|e\rangle", r"|a\rangle"], y_range=[-1, 1, 0.5],
+                        y_length=2, x_length=2).scale(0.8).to_corner(DR)
+        self.add_fixed_in_frame_mobjects(bars)
 
         self.play(
             Create(bloch),
-            Create(state_vector)
+            Create(state_vector),
+            FadeIn(bars)
         )
 
-        # Animation for single solution rotation
-        self.play(
-            Rotate(
-                state_vector,
-                angle=PI,
-                axis=UP,
-                about_point=ORIGIN
-            ),
-            run_time=2
-        )
+        # Animation for single solution rotation: one Grover iteration per step
+        for t in range(1, t_opt + 1):
+            self.play(
+                Rotate(
+                    state_vector,
+                    angle=angle[t] - angle[t-1],
+                    axis=UP,
+                    about_point=ORIGIN
+                ),
+                bars.animate.change_bar_values(amplitudes(t)),
+                run_time=2 / t_opt
+            )
 
         # Add annotations and comparisons
         comparison_text = Text(
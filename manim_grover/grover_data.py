@@ -0,0 +1,67 @@
+# grover_data.py  –  Grover amplitudes shared by the scenes, computed once per (N, M)
+#
+#   data = load()                  # N, M from GROVER_N / GROVER_M, default N=4, M=1
+#   data["theta"], data["t_opt"]   # sin θ = √(M/N), t_opt = ⌊π/(4θ)⌋
+#   data["amp_a"][t], data["amp_e"][t]   # per-state amplitudes after t iterations
+#   data["angle"][t]               # (2t+1)θ, the state's angle from |e>
+#
+# The amplitudes come from applying the oracle and the diffuser to the full
+# length-N amplitude array, not from the closed form, and are written to
+# DATA_DIR/grover_N<N>_M<M>_<source hash>.npz.  The hash is of this file, as
+# render.py's scene keys hash scene sources, so a changed compute() writes a
+# new file (replacing the old one) instead of serving stale amplitudes.
+# render.py precomputes the file before it starts its workers, so every scene
+# reads the same arrays instead of recomputing them or carrying hand-tuned
+# angles.  Marked states are the first M indices; only M matters to the
+# amplitudes.
+
+import os
+import hashlib
+import numpy as np
+from pathlib import Path
+
+DATA_DIR = Path(os.environ.get("GROVER_DATA_DIR", Path(__file__).with_name("media") / "data"))
+SOURCE_KEY = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+def problem():
+    return int(os.environ.get("GROVER_N", 4)), int(os.environ.get("GROVER_M", 1))
+
+def compute(N, M, t_max=None):
+    if not 0 < M < N:
+        raise ValueError(f"need 0 < M < N, got N={N}, M={M}")
+    theta = np.arcsin(np.sqrt(M/N))
+    t_opt = int(np.floor(np.pi/(4*theta)))
+    t_max = 2*t_opt + 1 if t_max is None else t_max
+    psi = np.full(N, 1/np.sqrt(N))
+    amp_a, amp_e = [psi[0]], [psi[-1]]
+    for _ in range(t_max):
+        psi[:M] *= -1                     # oracle
+        psi = 2*psi.mean() - psi          # diffuser
+        amp_a.append(psi[0]); amp_e.append(psi[-1])
+    amp_a, amp_e = np.array(amp_a), np.array(amp_e)
+    return {"N": N, "M": M, "theta": theta, "t_opt": t_opt,
+            "amp_a": amp_a, "amp_e": amp_e,
+            "angle": np.unwrap(np.arctan2(np.sqrt(M)*amp_a, np.sqrt(N-M)*amp_e))}
+
+def path(N, M):
+    return DATA_DIR / f"grover_N{N}_M{M}_{SOURCE_KEY}.npz"
+
+def precompute(N, M):
+    p = path(N, M)
+    if not p.exists():
+        p.parent.mkdir(parents=True, exist_ok=True)
+        stale = [*p.parent.glob(f"grover_N{N}_M{M}_*.npz"), p.with_name(f"grover_N{N}_M{M}.npz")]
+        for old in stale:
+            old.unlink(missing_ok=True)
+        np.savez(p, **compute(N, M))
+    return p
+
+def load(N=None, M=None):
+    if N is None or M is None:
+        N, M = problem()
+    with np.load(precompute(N, M)) as f:
+        data = {k: f[k] for k in f.files}
+    for k in ("N", "M", "t_opt"):
+        data[k] = int(data[k])
+    data["theta"] = float(data["theta"])
+    return data
@@ -1,5 +1,6 @@
 from manim import *
 from unit_circle_triangle import UnitCircleTriangle
+from grover_data import load
 
 class GroverEq3(Scene):
     def construct(self):
@@ -45,7 +46,8 @@ class GroverEq3(Scene):
         self.wait(2)
 
 
-        triangle = UnitCircleTriangle(np.sqrt(3)/2, 1/2)
+        theta = load()["theta"]      # GROVER_N / GROVER_M, see grover_data.py
+        triangle = UnitCircleTriangle(np.cos(theta), np.sin(theta))
         # triangle.move_to(3 * DOWN + 8 * RIGHT)
         triangle.move(2 * UP + 3 * RIGHT)
         self.play(Create(triangle))
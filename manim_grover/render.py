@@ -0,0 +1,124 @@
+# render.py  –  render every scene in parallel, skipping the ones that are up to date
+#
+#   python render.py                       # all scenes, low-resolution preview tier
+#   python render.py --quality final       # 1080p60
+#   python render.py GroverEq3 --force     # one scene, even if unchanged
+#   python render.py --N 256 --M 4         # scenes driven by a different problem
+#
+# Scenes are found by scanning the grover_*.py files for Scene subclasses, and
+# each is rendered by its own `manim render` process, up to --workers at once.
+# Before any worker starts, the Grover amplitudes for (N, M) are computed once
+# (grover_data.precompute) and passed down through GROVER_N / GROVER_M.
+#
+# A scene's key hashes its file, the local modules it imports, the quality
+# tier, the manim version and, for scenes that read grover_data, N and M.
+# media/render_manifest.json records the key each video was last rendered
+# with, so a scene is skipped while its key and video are unchanged.
+
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib.metadata import version, PackageNotFoundError
+import grover_data
+
+HERE = Path(__file__).resolve().parent
+MEDIA = HERE / "media"
+MANIFEST = MEDIA / "render_manifest.json"
+# tier -> (manim quality flag, output directory manim uses for it)
+QUALITY = {"preview": ("l", "480p15"), "medium": ("m", "720p30"), "final": ("h", "1080p60")}
+SCENE_RE = re.compile(r"^class (\w+)\((?:\w*Scene)\):", re.M)
+IMPORT_RE = re.compile(r"^(?:from|import) (\w+)", re.M)
+
+def scenes():
+    found = []
+    for path in sorted(HERE.glob("grover_*.py")):
+        found += [(path, name) for name in SCENE_RE.findall(path.read_text())]
+    return found
+
+# The scene file plus every module of this directory it imports, recursively
+def sources(path, seen=None):
+    seen = set() if seen is None else seen
+    if path in seen:
+        return seen
+    seen.add(path)
+    for module in IMPORT_RE.findall(path.read_text()):
+        local = HERE / f"{module}.py"
+        if local.exists():
+            sources(local, seen)
+    return seen
+
+def manim_version():
+    try:
+        return version("manim")
+    except PackageNotFoundError:
+        return None
+
+def scene_key(path, name, N, M, quality):
+    h, srcs = hashlib.sha256(), sorted(sources(path))
+    for src in srcs:
+        h.update(src.name.encode()); h.update(src.read_bytes())
+    if HERE / "grover_data.py" not in srcs:
+        N = M = None
+    h.update(json.dumps([name, N, M, quality, manim_version()]).encode())
+    return h.hexdigest()[:32]
+
+def output(path, name, quality):
+    return MEDIA / "videos" / path.stem / QUALITY[quality][1] / f"{name}.mp4"
+
+def render(path, name, N, M, quality):
+    env = dict(os.environ, GROVER_N=str(N), GROVER_M=str(M))
+    cmd = [sys.executable, "-m", "manim", "render", f"-q{QUALITY[quality][0]}",
+           "--media_dir", str(MEDIA), str(path), name]
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=HERE, env=env, capture_output=True, text=True)
+    return proc.returncode, time.perf_counter() - t0, proc.stderr[-2000:]
+
+def render_all(names=None, N=4, M=1, quality="preview", workers=None, force=False):
+    grover_data.precompute(N, M)
+    manifest = json.loads(MANIFEST.read_text()) if MANIFEST.exists() else {}
+    todo, skipped = [], []
+    for path, name in scenes():
+        if names and name not in names:
+            continue
+        entry, key = f"{path.name}:{name}:{quality}", scene_key(path, name, N, M, quality)
+        if not force and manifest.get(entry) == key and output(path, name, quality).exists():
+            skipped.append(name)
+        else:
+            todo.append((path, name, entry, key))
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        jobs = {pool.submit(render, path, name, N, M, quality): (name, entry, key)
+                for path, name, entry, key in todo}
+        for job in as_completed(jobs):
+            name, entry, key = jobs[job]
+            code, seconds, err = job.result()
+            if code == 0:
+                manifest[entry] = key
+                print(f"rendered {name} in {seconds:.1f}s")
+            else:
+                failed.append(name)
+                print(f"FAILED {name} (exit {code}):\n{err}")
+    MEDIA.mkdir(exist_ok=True)
+    MANIFEST.write_text(json.dumps(manifest, indent=1, sort_keys=True) + "\n")
+    if skipped:
+        print(f"up to date: {', '.join(skipped)}")
+    return failed
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Batch-render the Grover scenes")
+    ap.add_argument("scenes", nargs="*", help="scene class names (default: all)")
+    ap.add_argument("--quality", choices=list(QUALITY), default="preview")
+    ap.add_argument("--N", type=int, default=4, help="database size the scenes are drawn for")
+    ap.add_argument("--M", type=int, default=1, help="number of marked states")
+    ap.add_argument("--workers", type=int, help="parallel manim processes (default: all cores)")
+    ap.add_argument("--force", action="store_true", help="re-render even if up to date")
+    args = ap.parse_args()
+    failed = render_all(args.scenes, args.N, args.M, args.quality, args.workers, args.force)
+    raise SystemExit(1 if failed else 0)
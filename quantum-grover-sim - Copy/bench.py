@@ -0,0 +1,222 @@
+# bench.py  –  stage-by-stage timing of the Grover and ALU circuits, with history
+#
+#   python bench.py                        # quick grid, appended to bench_results/history.jsonl
+#   python bench.py --grid full            # n = 4 … 20, M = 1 / 4 / 16 / 256, k = 1 / 4 / 16
+#   python bench.py --check                # exit 1 on a regression against the baseline
+#   python bench.py --update               # accept this run as the baseline
+#   python bench.py --results-dir ~/bench  # keep history and baseline elsewhere
+#
+# A Grover point is timed stage by stage:
+#   build      grover_circuit(): oracle, diffuser and k iterations as gates
+#   transpile  compiled_parts() with a cold cache
+#   assemble   compiled_grover_circuit() from the cached parts
+#   simulate   backend.run() on the assembled circuit
+#   decode     counts_arrays() and marked_hits()
+# MCX points run the mcx oracle under the grover/mcx.py strategies on the
+# noise-free noisy backend, whose NOISE_BASIS makes the transpiler decompose
+# every MCX (the plain aer backend executes MCX natively, so it would hide the
+# gap).
+# ALU points (src/alu.py) time build, transpile and a permutation_sim check.
+# Cold-start points time a fresh interpreter running one command, from launch
+# to exit: importing the grover package and its CLI's run subcommand per engine.
+#
+# Every point runs in a fresh worker process, one at a time, so the peak RSS
+# reported for it is its own; stage times are the minimum over --repeat runs.
+# Each run appends {time, git, host, results} to the history file.  History
+# and baseline live in --results-dir (GROVER_BENCH_DIR, default bench_results/
+# next to this file, which git ignores), since timings belong to one machine.
+# --check without a baseline records this run as the baseline instead.  The
+# check flags a stage or total wall time or peak RSS more than --tolerance above
+# the baseline (ignoring changes under MIN_SECONDS), and any increase in a
+# gate count, which is deterministic.
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import resource
+import subprocess
+from pathlib import Path
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from qiskit import transpile
+from grover.noise import noise_engine
+
+HERE = Path(__file__).resolve().parent
+sys.path.append(str(HERE.parent / "src"))          # alu.py, permutation_sim.py
+
+RESULTS_DIR = Path(os.environ.get("GROVER_BENCH_DIR") or HERE / "bench_results")
+BASIS = ["cx", "u"]
+MIN_SECONDS = 0.005
+
+GRIDS = {
+    "quick": {"n": (4, 8, 12), "M": (1, 4), "k": (1, 4), "mcx_n": (8,), "alu_bits": (4, 8, 16)},
+    "full": {"n": (4, 8, 12, 16, 20), "M": (1, 4, 16, 256), "k": (1, 4, 16), "mcx_n": (8, 12),
+             "alu_bits": (4, 8, 16, 32, 64)},
+}
+MCX_ORACLES = ("mcx", "mcx:vchain=2", "mcx:relative-phase=2", "mcx:vchain-dirty=1",
+               "mcx:relative-phase")
+MCX_ENGINE = noise_engine()                 # "noisy:" with every level at zero
+
+def _timed(fn, repeat):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return out, best
+
+def _gates(qc):
+    return {"size": qc.size(), "depth": qc.depth(),
+            "two_qubit": sum(1 for inst in qc.data if inst.operation.num_qubits == 2)}
+
+def _peak_rss():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024     # KiB on Linux
+
+def grover_point(n, M, k, oracle="mcx", shots=1024, repeat=1, engine="aer"):
+    from grover import simulate as g, circuits
+    from grover.readout import counts_arrays, marked_hits
+    marked = [i * (2**n // M) for i in range(M)]
+    b = g.engine_backend(engine, g.grover_width(n, oracle))
+    stages = {}
+    _, stages["build"] = _timed(lambda: circuits.grover_circuit(n, marked, k, oracle), repeat)
+    def cold_compile():
+        g.circuit_cache.clear()
+        return g.compiled_parts(n, marked, oracle, b)
+    _, stages["transpile"] = _timed(cold_compile, repeat)
+    tqc, stages["assemble"] = _timed(lambda: g.compiled_grover_circuit(n, marked, k, oracle=oracle,
+                                                                       backend=b), repeat)
+    result, stages["simulate"] = _timed(lambda: b.run(tqc, shots=shots, seed_simulator=0).result(),
+                                        repeat)
+    def decode():
+        outcomes, counts = counts_arrays(result.data(0)["counts"])
+        return marked_hits(outcomes, counts, n, marked) / shots
+    _, stages["decode"] = _timed(decode, repeat)
+    return {"stages": stages, "wall": sum(stages.values()), "peak_rss": _peak_rss(),
+            "gates": _gates(tqc), "aer_seconds": result.time_taken}
+
+def alu_point(op, bits, samples=4096, repeat=1):
+    import alu
+    builders = {"and": alu.and_circuit, "xor": alu.xor_circuit, "add": alu.adder_circuit}
+    stages = {}
+    (qc, out), stages["build"] = _timed(lambda: builders[op](bits), repeat)
+    tqc, stages["transpile"] = _timed(lambda: transpile(qc, basis_gates=BASIS, seed_transpiler=0),
+                                      repeat)
+    report, stages["verify"] = _timed(lambda: alu.verify_truth_table(
+        qc, out, alu.TRUTH_TABLES[op], method="permutation", shots=samples, seed=0), repeat)
+    if report["failures"]:
+        raise AssertionError(f"{op} on {bits} bits failed its truth table")
+    return {"stages": stages, "wall": sum(stages.values()), "peak_rss": _peak_rss(),
+            "gates": _gates(tqc)}
+
+COLD_STARTS = {
+    "import": ["-c", "import grover"],
+    "run/analytic": ["-m", "grover", "run", "10", "--engine", "analytic"],
+    "run/numpy": ["-m", "grover", "run", "10", "--engine", "numpy"],
+    "run/aer": ["-m", "grover", "run", "6", "--engine", "aer", "--shots", "256"],
+}
+
+def cold_start_point(command, repeat=1):
+    argv = [sys.executable, *COLD_STARTS[command]]
+    _, seconds = _timed(lambda: subprocess.run(argv, cwd=HERE, check=True, capture_output=True),
+                        repeat)
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024
+    return {"stages": {"start": seconds}, "wall": seconds, "peak_rss": peak, "gates": {}}
+
+def points(grid, oracle="mcx"):
+    g = GRIDS[grid]
+    for command in COLD_STARTS:
+        yield f"cold/{command}", cold_start_point, dict(command=command)
+    for n in g["n"]:
+        for M in g["M"]:
+            if M > 2**n // 2:
+                continue
+            for k in g["k"]:
+                yield f"grover/{oracle}/n={n}/M={M}/k={k}", grover_point, dict(n=n, M=M, k=k,
+                                                                             oracle=oracle)
+    for n in g["mcx_n"]:
+        for mcx in MCX_ORACLES:
+            yield f"mcx/{mcx}/n={n}", grover_point, dict(n=n, M=1, k=1, oracle=mcx,
+                                                         engine=MCX_ENGINE)
+    for bits in g["alu_bits"]:
+        for op in ("and", "xor", "add"):
+            yield f"alu/{op}/bits={bits}", alu_point, dict(op=op, bits=bits)
+
+def run(grid="quick", oracle="mcx", repeat=1, only=None):
+    results = {}
+    for name, fn, kwargs in points(grid, oracle):
+        if only and only not in name:
+            continue
+        with ProcessPoolExecutor(max_workers=1) as pool:       # fresh process, own peak RSS
+            results[name] = pool.submit(fn, **kwargs, repeat=repeat).result()
+        r = results[name]
+        print(f"{name:<34}{r['wall']:>9.3f}s{r['peak_rss']/2**20:>9.0f} MiB"
+              f"{r['gates'].get('size', '-'):>9} gates  " +
+              "  ".join(f"{s}={t*1e3:.1f}ms" for s, t in r["stages"].items()))
+    return results
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# Returns (name, metric, baseline, now) rows that got worse
+def regressions(results, baseline, tolerance=0.25):
+    worse = []
+    for name, now in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        timings = [(f"stage.{s}", t, before["stages"].get(s)) for s, t in now["stages"].items()]
+        for metric, value, old in timings + [("wall", now["wall"], before["wall"])]:
+            if old is not None and value > old*(1 + tolerance) and value - old > MIN_SECONDS:
+                worse.append((name, metric, old, value))
+        if now["peak_rss"] > before["peak_rss"]*(1 + tolerance):
+            worse.append((name, "peak_rss", before["peak_rss"], now["peak_rss"]))
+        for metric, value in now["gates"].items():
+            old = before["gates"].get(metric)
+            if old is not None and value > old:
+                worse.append((name, f"gates.{metric}", old, value))
+    return worse
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Benchmark the Grover and ALU pipelines stage by stage")
+    ap.add_argument("--grid", choices=sorted(GRIDS), default="quick")
+    ap.add_argument("--oracle", default="mcx", help="oracle builder for the Grover points")
+    ap.add_argument("--repeat", type=int, default=3, help="runs per stage; the minimum is kept")
+    ap.add_argument("--only", help="run only the points whose name contains this")
+    ap.add_argument("--check", action="store_true", help="fail on a regression against the baseline")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+    ap.add_argument("--update", action="store_true", help="write this run as the baseline")
+    ap.add_argument("--results-dir", type=Path, default=RESULTS_DIR,
+                    help="where the history and baseline files go (GROVER_BENCH_DIR)")
+    ap.add_argument("--history", type=Path, help="default: history.jsonl in --results-dir")
+    ap.add_argument("--baseline", type=Path, help="default: baseline.json in --results-dir")
+    args = ap.parse_args()
+    args.history = args.history or args.results_dir / "history.jsonl"
+    args.baseline = args.baseline or args.results_dir / "baseline.json"
+    if args.check and not args.update and not args.baseline.exists():
+        print(f"no baseline at {args.baseline}: recording this run as the baseline")
+        args.update = True
+
+    results = run(args.grid, args.oracle, args.repeat, args.only)
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.history, "a") as f:
+        f.write(json.dumps({"time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                            "git": git_rev(), "host": socket.gethostname(), "grid": args.grid,
+                            "results": results}, sort_keys=True) + "\n")
+    if args.update:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline, indent=1, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+    elif args.check:
+        worse = regressions(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for name, metric, before, value in worse:
+            print(f"REGRESSION {name} {metric}: {before:.4g} -> {value:.4g}")
+        raise SystemExit(1 if worse else 0)
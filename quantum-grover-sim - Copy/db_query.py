@@ -0,0 +1,158 @@
+# db_query.py  –  Grover search over a classical table, with a classical scan baseline
+#
+#   table = Table.from_csv("people.csv")
+#   report = table.query("age", "<", 30, engine="numpy")
+#   report["row"], report["oracle_calls"], report["checks"], report["scan_rows"]
+#   python db_query.py people.csv age "<" 30 --engine numpy
+#
+# Each queried column gets a sort index: the i-th record in the column's sorted
+# order is basis state |i>, so ==, <, <=, >, >= and between all select a
+# contiguous run of states lo..hi-1 and compile to build_range_oracle (two
+# integer comparators, see grover/oracles.py) whatever the number of matches.
+#
+# The index also gives M, so a query runs k = ⌊π/4·√(N/M)⌋ iterations, checks
+# the measured record classically and retries on a miss; method="bbht" ignores
+# M and runs BBHT rounds instead.  oracle_calls counts Grover iterations and
+# checks the classical verifications of measured records, one per round, so
+# neither is mistaken for the other next to the scan's rows examined.
+# Prepared queries (range, k and, on the aer engine or with depth=True, the
+# compiled circuit's depth) are cached per (column, op, value), and the oracle
+# and diffuser themselves sit in grover.simulate's circuit cache.
+
+import csv
+import math
+import time
+import bisect
+import operator
+import argparse
+from grover.simulate import (compiled_grover_circuit, run_grover_int_counts, bbht_rounds,
+                             bbht_max_calls, gate_level)
+from grover.engines import make_rng
+
+# op -> (index range of the matches in sorted order, the row-by-row predicate)
+OPS = {
+    "==": (lambda v, x: (bisect.bisect_left(v, x), bisect.bisect_right(v, x)), operator.eq),
+    "<":  (lambda v, x: (0, bisect.bisect_left(v, x)), operator.lt),
+    "<=": (lambda v, x: (0, bisect.bisect_right(v, x)), operator.le),
+    ">":  (lambda v, x: (bisect.bisect_right(v, x), len(v)), operator.gt),
+    ">=": (lambda v, x: (bisect.bisect_left(v, x), len(v)), operator.ge),
+    "between": (lambda v, x: (bisect.bisect_left(v, x[0]), bisect.bisect_right(v, x[1])),
+                lambda a, x: x[0] <= a <= x[1]),
+}
+
+def _parse(value):
+    for kind in (int, float):
+        try:
+            return kind(value)
+        except ValueError:
+            pass
+    return value
+
+def _query_key(column, op, value):
+    return column, op, tuple(value) if op == "between" else value
+
+class Table:
+    def __init__(self, rows):
+        self.rows = [dict(r) for r in rows]
+        self.n = max(2, math.ceil(math.log2(max(len(self.rows), 1))))
+        self._index = {}                   # column -> (sorted values, row order)
+        self._prepared = {}                # (column, op, value) -> prepared query
+
+    @classmethod
+    def from_csv(cls, path):
+        with open(path, newline="") as f:
+            return cls([{k: _parse(v) for k, v in r.items()} for r in csv.DictReader(f)])
+
+    def index(self, column):
+        if column not in self._index:
+            order = sorted(range(len(self.rows)), key=lambda i: self.rows[i][column])
+            self._index[column] = [self.rows[i][column] for i in order], order
+        return self._index[column]
+
+    # depth=True also compiles the Aer circuit for its depth, once per query
+    def prepare(self, column, op, value, depth=False):
+        key = _query_key(column, op, value)
+        if key not in self._prepared:
+            t0 = time.perf_counter()
+            values, _ = self.index(column)
+            lo, hi = OPS[op][0](values, value)
+            marked = list(range(lo, max(lo, hi)))
+            k = math.floor((math.pi/4)*math.sqrt(2**self.n/len(marked))) if marked else 0
+            self._prepared[key] = {"column": column, "marked": marked, "M": len(marked),
+                                   "k": k, "depth": None,
+                                   "compile_seconds": time.perf_counter() - t0}
+        q = self._prepared[key]
+        if depth and q["depth"] is None:
+            t0 = time.perf_counter()
+            q["depth"] = (compiled_grover_circuit(self.n, q["marked"], q["k"], oracle="range")
+                          .depth() if q["marked"] else 0)
+            q["compile_seconds"] += time.perf_counter() - t0
+        return q
+
+    # Rows examined, in table order, until the first match
+    def scan(self, column, op, value):
+        pred = OPS[op][1]
+        for i, row in enumerate(self.rows):
+            if pred(row[column], value):
+                return row, i + 1
+        return None, len(self.rows)
+
+    # depth: report the compiled circuit's depth (default: on gate-level engines)
+    def query(self, column, op, value, engine="aer", method="known", seed=None, depth=None):
+        cached = _query_key(column, op, value) in self._prepared
+        t0 = time.perf_counter()
+        q = self.prepare(column, op, value, gate_level(engine) if depth is None else depth)
+        rng, n, marked = make_rng(seed), self.n, q["marked"]
+        hit = lambda state: bool(marked) and marked[0] <= state <= marked[-1]
+        x, calls, checks = None, 0, 0
+        if method == "bbht":
+            for j, state in bbht_rounds(n, marked, engine, "range", int(rng.integers(2**32))):
+                calls, checks = calls + j, checks + 1
+                if hit(state):
+                    x = state
+                    break
+                if calls + checks >= bbht_max_calls(n):
+                    break
+        else:
+            while marked and x is None:    # an empty range needs no quantum search
+                outcomes, _ = run_grover_int_counts(n, marked, q["k"], 1, engine, "range",
+                                                    int(rng.integers(2**32)))
+                calls, checks = calls + q["k"], checks + 1
+                if hit(outcomes[0]):
+                    x = int(outcomes[0])
+        wall = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        _, scan_rows = self.scan(column, op, value)
+        scan_wall = time.perf_counter() - t0
+        row = None if x is None else self.rows[self.index(column)[1][x]]
+        return {"row": row, "state": x, "N": 2**n, "rows": len(self.rows), "M": q["M"],
+                "k": q["k"], "oracle_calls": calls, "checks": checks, "depth": q["depth"],
+                "prepared_cached": cached, "wall_seconds": wall,
+                "scan_rows": scan_rows, "scan_seconds": scan_wall}
+
+def format_report(r):
+    depth = "" if r["depth"] is None else f", depth {r['depth']}"
+    return (f"match {r['row']}\n"
+            f"  grover: {r['oracle_calls']} oracle calls and {r['checks']} checks "
+            f"(k={r['k']}, M={r['M']} of N={r['N']}){depth}, {r['wall_seconds']*1e3:.1f} ms"
+            f"{' (prepared)' if r['prepared_cached'] else ''}\n"
+            f"  scan:   {r['scan_rows']} of {r['rows']} rows examined, "
+            f"{r['scan_seconds']*1e3:.3f} ms")
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Grover query against a CSV table")
+    ap.add_argument("csv")
+    ap.add_argument("column")
+    ap.add_argument("op", choices=sorted(OPS))
+    ap.add_argument("value", nargs="+", help="one value, or two for between")
+    ap.add_argument("--engine", choices=["aer", "numpy", "analytic"], default="aer")
+    ap.add_argument("--method", choices=["known", "bbht"], default="known")
+    ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--depth", action="store_true", help="report circuit depth on any engine")
+    args = ap.parse_args()
+    values = [_parse(v) for v in args.value]
+    value = tuple(values[:2]) if args.op == "between" else values[0]
+    table = Table.from_csv(args.csv)
+    print(format_report(table.query(args.column, args.op, value, args.engine,
+                                    args.method, args.seed, args.depth or None)))
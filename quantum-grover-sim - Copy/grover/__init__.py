@@ -0,0 +1,45 @@
+# grover  –  Grover search simulation as a library, and its CLI (python -m grover)
+#
+#   import grover
+#   grover.run_grover_prob(10, [3], 25, engine="analytic", seed=1)
+#   grover.grover_circuit(4, [3], k=2)       # first use imports qiskit
+#
+#   circuits.py   oracle, diffuser, grover_circuit        (qiskit)
+#   simulate.py   runs, sweeps, batches and searches      (numpy; qiskit, Aer on demand)
+#   plots.py      the grover_sim.py figures               (matplotlib)
+#   cli.py        python -m grover run|sweep|plot|search
+#
+# and the helpers they share, each importable on its own (grover.noise,
+# grover.mcx, grover.runner, ...): engines, readout, stats, execution, noise,
+# mcx, oracles, circuit_cache, result_store, runner and profiling.
+#
+# Importing the package imports none of them: each name below loads its
+# module on first access, so `import grover` costs nothing and a caller
+# only pays for the backends it uses.  Nothing is seeded at import; pass
+# seed= or use the CLI's --seed.
+
+import importlib
+
+_EXPORTS = {
+    "circuits": ("build_oracle", "diffuser", "ORACLES", "oracle_gate", "diffuser_gate",
+                 "grover_circuit"),
+    "simulate": ("grover_width", "engine_backend", "fit_n_max", "compiled_parts",
+                 "compiled_grover_circuit", "circuit_cache", "ENGINES", "point_spec",
+                 "run_grover_int_counts", "run_grover_counts", "run_grover_prob",
+                 "run_grover_prob_ci", "run_grover_prob_adaptive", "sweep_grover_batch",
+                 "sweep_grover_probs", "run_grover_batch", "check_against_analytic",
+                 "search_grover_unknown_M", "search_grover_bbht"),
+    "plots": ("plot_oscillations", "plot_scaling", "plot_scaling_fixed_M",
+              "save_circuit_diagram", "plot_unknown_M_summary"),
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULES)
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{_MODULES[name]}", __name__), name)
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,63 @@
+# grover/circuit_cache.py  –  LRU cache of transpiled circuit pieces with an optional qpy disk tier
+#
+# Keys are tuples of plain values, e.g. ("oracle", "aer_simulator", n, marked).
+# A miss calls build(), times it, and writes the result through to disk_dir
+# (if set); a hit is credited with the build time it avoided.
+
+import time
+import hashlib
+from pathlib import Path
+from collections import OrderedDict
+
+class CircuitCache:
+    def __init__(self, maxsize=256, disk_dir=None):
+        self.maxsize = maxsize
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._mem = OrderedDict()          # key -> (circuit, build seconds)
+        self.hits = self.disk_hits = self.misses = 0
+        self.build_seconds = self.saved_seconds = 0.0
+
+    def _path(self, key):
+        return self.disk_dir / (hashlib.sha256(repr(key).encode()).hexdigest()[:32] + ".qpy")
+
+    def get(self, key, build):
+        if key in self._mem:
+            self._mem.move_to_end(key)
+            self.hits += 1
+            self.saved_seconds += self._mem[key][1]
+            return self._mem[key][0]
+        if self.disk_dir and self._path(key).exists():
+            from qiskit import qpy
+            with open(self._path(key), "rb") as f:
+                qc = qpy.load(f)[0]
+            seconds = qc.metadata.get("build_seconds", 0.0)
+            self.disk_hits += 1
+            self.saved_seconds += seconds
+        else:
+            t0 = time.perf_counter()
+            qc = build()
+            seconds = time.perf_counter() - t0
+            self.misses += 1
+            self.build_seconds += seconds
+            if self.disk_dir:
+                self.disk_dir.mkdir(parents=True, exist_ok=True)
+                qc.metadata = {**(qc.metadata or {}), "build_seconds": seconds}
+                from qiskit import qpy
+                with open(self._path(key), "wb") as f:
+                    qpy.dump(qc, f)
+        self._mem[key] = (qc, seconds)
+        while len(self._mem) > self.maxsize:
+            self._mem.popitem(last=False)
+        return qc
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits)/lookups if lookups else 0.0,
+                "build_seconds": self.build_seconds, "saved_seconds": self.saved_seconds,
+                "size": len(self._mem)}
+
+    def clear(self):
+        self._mem.clear()
+        self.hits = self.disk_hits = self.misses = 0
+        self.build_seconds = self.saved_seconds = 0.0
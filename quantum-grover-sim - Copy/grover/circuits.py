@@ -0,0 +1,67 @@
+# grover/circuits.py  –  oracle, diffuser and the textbook Grover circuit
+#
+#   grover_circuit(4, [3], k=2)              # 5 qubits: mcx oracle with its ancilla
+#   ORACLES["phase"]([3, 5], 4)              # any builder, as a gate
+#   grover_circuit(10, [3], 25, oracle="mcx:relative-phase")   # 8 MCX ancillas
+#
+# The only module of the package that imports qiskit at the top; simulate.py
+# reaches it from the functions that compile circuits.
+
+from qiskit import QuantumCircuit
+from .oracles import build_phase_oracle, build_esop_oracle, build_range_oracle
+from .mcx import append_mcx, parse_oracle, mcx_ancillas
+
+# 1 ▸ Oracle & diffuser — strategy and ancillas choose the MCX construction
+#     (mcx.py); the ancilla wires come after the oracle's own qubits
+def build_oracle(marked, n, strategy="noancilla", ancillas=0):
+    qc = QuantumCircuit(n+1+ancillas)
+    anc = n
+    for state in marked:
+        for q in range(n):
+            if ((state >> q) & 1) == 0:
+                qc.x(q)
+        qc.h(anc)
+        append_mcx(qc, range(n), anc, range(n+1, n+1+ancillas), strategy)
+        qc.h(anc)
+        for q in range(n):
+            if ((state >> q) & 1) == 0:
+                qc.x(q)
+    return qc.to_gate(label="O")
+
+def diffuser(n, strategy="noancilla", ancillas=0):
+    qc = QuantumCircuit(n+ancillas)
+    qc.h(range(n)); qc.x(range(n))
+    qc.h(n-1); append_mcx(qc, range(n-1), n-1, range(n, n+ancillas), strategy); qc.h(n-1)
+    qc.x(range(n)); qc.h(range(n))
+    return qc.to_gate(label="D")
+
+# Oracle builders share build_oracle's signature; see oracles.py.  An oracle
+# wider than n qubits gets qubit n prepared in |1> as its kickback ancilla.
+# "range" needs a contiguous marked set (db_query.py compiles predicates to one).
+ORACLES = {"mcx": build_oracle, "phase": build_phase_oracle, "esop": build_esop_oracle,
+           "range": build_range_oracle}
+
+# oracle is a builder name, optionally with an MCX strategy: "mcx:vchain=4"
+def oracle_gate(oracle, marked, n):
+    name, strategy, _ = parse_oracle(oracle)
+    return ORACLES[name](marked, n, strategy, mcx_ancillas(oracle, n))
+
+def diffuser_gate(oracle, n):
+    _, strategy, _ = parse_oracle(oracle)
+    return diffuser(n, strategy, mcx_ancillas(oracle, n))
+
+# The diffuser acts on the data qubits and the trailing MCX ancillas
+def diffuser_wires(oracle, n, width):
+    return list(range(n)) + list(range(width - mcx_ancillas(oracle, n), width))
+
+def grover_circuit(n, marked, k, oracle="mcx"):
+    O, D = oracle_gate(oracle, marked, n), diffuser_gate(oracle, n)
+    qc = QuantumCircuit(O.num_qubits, n)
+    if O.num_qubits - mcx_ancillas(oracle, n) > n:
+        qc.x(n)
+    qc.h(range(n))
+    for _ in range(k):
+        qc.append(O, range(O.num_qubits))
+        qc.append(D, diffuser_wires(oracle, n, O.num_qubits))
+    qc.measure(range(n), range(n))
+    return qc
@@ -0,0 +1,182 @@
+# grover/cli.py  –  python -m grover run|sweep|plot|search
+#
+#   python -m grover run 10 -m 3 --engine analytic        # p and its Wilson interval
+#   python -m grover sweep 8 -m 5 17 --k-max 16           # p for k = 0 … 16
+#   python -m grover search 10 -m 42 --method bbht        # unknown-M search
+#   python -m grover plot --engine numpy --workers 8      # the grover_sim.py figures
+#
+# Every subcommand shares the engine options (--engine, the noise levels,
+# --oracle, --mcx, --ancillas, --seed, --memory-mb, --precision).  Only the
+# modules a command needs are imported, inside its handler: run, sweep and
+# search on the numpy or analytic engine load neither qiskit nor matplotlib,
+# aer and noisy runs add qiskit and qiskit_aer, and only plot loads
+# matplotlib (grover.plots).
+# bench.py tracks the resulting start-up times as its cold/ points.
+
+import os
+import math
+import random
+import argparse
+from functools import partial
+from .noise import NOISE_PARAMS, noise_engine
+from .mcx import MCX_STRATEGIES, mcx_oracle
+
+# grover.circuits.ORACLES and grover.simulate.ENGINES, named here so that
+# parsing the command line imports neither
+ORACLES = ("esop", "mcx", "phase", "range")
+ENGINES = ("aer", "analytic", "numpy", "noisy")
+
+def optimal_k(n, M):
+    return int(math.floor(math.pi/(4*math.asin(math.sqrt(M/2**n)))))
+
+def cmd_run(args):
+    from .simulate import run_grover_prob_ci, run_grover_prob_adaptive
+    k = optimal_k(args.n, len(args.marked)) if args.k is None else args.k
+    confidence = 0.99 if args.adaptive else 0.95
+    label = "sequential CI, Bonferroni-adjusted over looks" if args.adaptive else "CI"
+    if args.adaptive:
+        p, (lo, hi), shots = run_grover_prob_adaptive(args.n, args.marked, k, confidence=confidence,
+                                                      max_shots=args.shots, engine=args.engine,
+                                                      oracle=args.oracle, seed=args.seed)
+    else:
+        shots = args.shots
+        p, (lo, hi) = run_grover_prob_ci(args.n, args.marked, k, shots, args.engine, args.oracle,
+                                         args.seed, confidence)
+    print(f"n={args.n} M={len(args.marked)} k={k} shots={shots}  p={p:.4f}  "
+          f"{confidence:.0%} {label} [{lo:.4f}, {hi:.4f}]")
+
+def cmd_sweep(args):
+    from .simulate import sweep_grover_probs
+    k_max = 2*optimal_k(args.n, len(args.marked)) + 1 if args.k_max is None else args.k_max
+    shots = None if args.exact else args.shots
+    probs = sweep_grover_probs(args.n, args.marked, k_max, shots, args.engine, args.oracle,
+                               args.seed)
+    for k, p in enumerate(probs):
+        print(f"{k:>4}  {p:.4f}")
+
+def cmd_search(args):
+    from .simulate import search_grover_unknown_M, search_grover_bbht
+    if args.method == "bbht":
+        x, k, calls = search_grover_bbht(args.n, args.marked, args.engine, args.oracle, args.seed)
+        print(f"found x={x} after j={k} iterations, {calls} oracle calls" if x is not None
+              else f"nothing found in {calls} oracle calls")
+    else:
+        k, calls = search_grover_unknown_M(args.n, args.marked, args.threshold, args.shots,
+                                           args.engine, args.oracle, args.seed, "scan",
+                                           args.adaptive)
+        print(f"p >= {args.threshold} at k={k}, {calls} oracle calls" if k is not None
+              else "threshold not reached")
+
+def cmd_plot(args, ap):
+    import numpy as np
+    from .runner import run_tasks
+    from .result_store import ResultStore
+    from . import simulate
+    from .plots import (plot_oscillations, plot_scaling, plot_scaling_fixed_M,
+                        save_circuit_diagram, plot_unknown_M_summary)
+    random.seed(args.seed)                 # the in-process oscillation plot draws from these
+    np.random.seed(args.seed)
+    n_max = {}
+    for name, default in (("scaling", 10), ("fixed_M", 14)):
+        n_max[name] = simulate.fit_n_max(args.n_max or default, args.engine, args.oracle)
+        if n_max[name] < (args.n_max or default):
+            print(f"{name} sweep: n > {n_max[name]} does not fit the memory budget, "
+                  f"stopping at n = {n_max[name]}")
+    if args.plot_only and not args.store:
+        ap.error("--plot-only needs --store")
+    if args.store:
+        max_bytes = args.store_max_mb and int(args.store_max_mb * 2**20)
+        simulate.result_store = ResultStore(args.store, max_bytes)
+    store = simulate._result_store()
+    if args.export and store is None:
+        ap.error("--export needs --store (or GROVER_STORE)")
+    runner = None
+    if args.workers or args.store or args.queue:
+        runner = partial(run_tasks, workers=args.workers, store=store, seed=args.seed,
+                         queue_dir=args.queue, stale_after=args.stale_after,
+                         compute=not args.plot_only)
+    plot_oscillations(args.engine, args.oracle, runner)
+    plot_scaling(args.engine, n_max["scaling"], args.oracle, runner)
+    for M in [1,4,16]:
+        plot_scaling_fixed_M(M, args.engine, n_max["fixed_M"], args.oracle, runner)
+    save_circuit_diagram()
+    plot_unknown_M_summary(args.engine, args.oracle, runner, args.search, args.adaptive)
+    # worker processes build their circuits in their own caches, so this
+    # process's counts only describe runs made without a pool
+    in_process = runner is None or args.workers == 1
+    if simulate.gate_level(args.engine) and not args.plot_only and in_process:
+        print("compiled-circuit cache:", simulate.circuit_cache.stats())
+    if args.export:
+        store.export(args.export)
+
+def parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--engine", choices=ENGINES, default="aer")
+    for param in NOISE_PARAMS:
+        common.add_argument(f"--{param}", type=float, default=0.0,
+                            help="noise level for --engine noisy (see noise.py)")
+    common.add_argument("--oracle", choices=ORACLES, default="mcx")
+    common.add_argument("--mcx", choices=MCX_STRATEGIES, default="noancilla",
+                        help="multi-controlled X construction (mcx.py)")
+    common.add_argument("--ancillas", type=int,
+                        help="ancilla budget for --mcx (default: a full ladder, n-2)")
+    common.add_argument("--seed", type=int, default=42, help="base seed of the run")
+    common.add_argument("--memory-mb", type=float, help="memory budget per simulation (execution.py)")
+    common.add_argument("--precision", choices=["single", "double"],
+                        help="pin the simulator precision (default: double while it fits)")
+    problem = argparse.ArgumentParser(add_help=False)
+    problem.add_argument("n", type=int, help="search register width, N = 2^n")
+    problem.add_argument("-m", "--marked", type=int, nargs="+", default=[0], help="marked states")
+    problem.add_argument("--shots", type=int, default=4096)
+
+    ap = argparse.ArgumentParser(prog="grover", description="Grover search simulation")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("run", parents=[common, problem], help="success probability after k iterations")
+    p.add_argument("-k", type=int, help="Grover iterations (default: optimal for M)")
+    p.add_argument("--adaptive", action="store_true",
+                   help="sequential shot allocation, --shots at most")
+    p = sub.add_parser("sweep", parents=[common, problem], help="success probability for k = 0 … k_max")
+    p.add_argument("--k-max", type=int, help="last k (default: twice the optimum, plus one)")
+    p.add_argument("--exact", action="store_true", help="no shot noise (numpy / analytic / aer)")
+    p = sub.add_parser("search", parents=[common, problem], help="unknown-M search")
+    p.add_argument("--method", choices=["scan", "bbht"], default="scan")
+    p.add_argument("--threshold", type=float, default=0.95, help="scan: success probability to reach")
+    p.add_argument("--adaptive", action="store_true", help="scan: sequential shot allocation")
+    p = sub.add_parser("plot", parents=[common], help="draw the figures of grover_sim.py")
+    p.add_argument("--n-max", type=int, help="largest n in the scaling sweeps")
+    p.add_argument("--search", choices=["scan", "bbht"], default="scan", help="unknown-M search method")
+    p.add_argument("--adaptive", action="store_true", help="sequential shot allocation in the scan")
+    p.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    p.add_argument("--store", "--checkpoint", help="result store directory, for resuming and replotting")
+    p.add_argument("--store-max-mb", type=float, help="evict least recently used results beyond this")
+    p.add_argument("--plot-only", action="store_true", help="draw from the store without simulating")
+    p.add_argument("--export", help="write the store's contents to this JSON-lines file")
+    p.add_argument("--queue", help="shared directory for a multi-host job queue")
+    p.add_argument("--stale-after", type=float,
+                   help="take over queue locks older than this many seconds (locks of "
+                        "exited processes on this host are always taken over)")
+    return ap
+
+def main(argv=None):
+    ap = parser()
+    args = ap.parse_args(argv)
+    if args.engine == "noisy":
+        args.engine = noise_engine(**{p: getattr(args, p) for p in NOISE_PARAMS})
+    if args.ancillas is not None and args.mcx == "noancilla":
+        ap.error("--ancillas needs an --mcx strategy other than noancilla")
+    args.oracle = mcx_oracle(args.oracle, args.mcx, args.ancillas)
+    if args.command != "plot":
+        from .readout import marked_states
+        try:
+            marked_states(args.n, args.marked)
+        except ValueError as e:
+            ap.error(str(e))
+    # through the environment, so runner worker processes see them too
+    if args.memory_mb:
+        os.environ["GROVER_MEMORY_MB"] = str(args.memory_mb)
+    if args.precision:
+        os.environ["GROVER_PRECISION"] = args.precision
+    if args.command == "plot":
+        cmd_plot(args, ap)
+    else:
+        {"run": cmd_run, "sweep": cmd_sweep, "search": cmd_search}[args.command](args)
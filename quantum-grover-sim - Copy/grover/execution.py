@@ -0,0 +1,115 @@
+# grover/execution.py  –  memory-budgeted choice of simulation method and precision
+#
+#   select(24)                             # Profile('statevector', 'double', 268435456)
+#   select(32, budget=40 * 2**30)          # single precision: double needs 64 GiB
+#   select(6, mixed=True)                  # density matrix, exact under noise
+#   simulator(*select(n)[:2])              # the AerSimulator for that method, precision
+#
+# A statevector holds 2^n complex amplitudes (16 bytes in double precision, 8
+# in single), a density matrix 4^n, and a matrix-product state one 2×χ×χ
+# tensor per site for a bond-dimension cap χ.  select() walks the candidates
+# in order of preference — density matrix first only when a mixed state is
+# asked for, then statevector in double and single precision, then MPS — and
+# returns the first that fits the budget.  If none does it raises MemoryError
+# saying how much the cheapest one needs; max_qubits() gives the widest job
+# that would fit, for sweeps that scale themselves down instead.
+#
+# Iteration sweeps also keep a save_probabilities snapshot per k, 2^n float64
+# each for the n-qubit search register, which Aer holds until the job ends:
+# select(..., extra_bytes=snapshot_bytes(n)) sizes a job with one of them,
+# and snapshot_chunks() splits k = 0 … k_max into runs that fit beside it.
+#
+# The budget is GROVER_MEMORY_MB if set, else half the physical memory, and
+# GROVER_PRECISION=single|double pins the precision.  Simulators get the
+# budget as max_memory_mb, so Aer also caps its parallel shots to it; they
+# are cached per budget too, so a changed GROVER_MEMORY_MB takes effect.
+# qiskit_aer is imported by simulator() itself, so sizing a job is cheap.
+
+import os
+from collections import namedtuple
+from functools import lru_cache
+
+BYTES = {"double": 16, "single": 8}          # per complex amplitude
+MPS_BOND = 64
+
+Profile = namedtuple("Profile", "method precision bytes")
+
+def default_budget():
+    if os.environ.get("GROVER_MEMORY_MB"):
+        return int(float(os.environ["GROVER_MEMORY_MB"]) * 2**20)
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // 2
+
+def job_bytes(num_qubits, method="statevector", precision="double", max_bond=MPS_BOND):
+    if method == "statevector":
+        return 2**num_qubits * BYTES[precision]
+    if method == "density_matrix":
+        return 4**num_qubits * BYTES[precision]
+    if method == "matrix_product_state":   # bond i is at most 2^min(i, n-i) wide
+        bonds = [1] + [min(max_bond, 2**min(i, num_qubits-i)) for i in range(1, num_qubits)] + [1]
+        return sum(2 * bonds[i] * bonds[i+1] for i in range(num_qubits)) * BYTES[precision]
+    raise ValueError(f"unknown method {method!r}")
+
+def candidates(mixed=False, precision=None, allow_mps=True):
+    precision = precision or os.environ.get("GROVER_PRECISION")
+    precisions = [precision] if precision else ["double", "single"]
+    methods = (["density_matrix"] if mixed else []) + ["statevector"] + \
+              (["matrix_product_state"] if allow_mps else [])
+    return [(m, p) for m in methods for p in precisions]
+
+def _size(nbytes):
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB", "PiB"):
+        if nbytes < 1024 or unit == "PiB":
+            return f"{nbytes:.0f} {unit}" if unit == "B" else f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+
+def select(num_qubits, budget=None, mixed=False, precision=None, allow_mps=True, extra_bytes=0):
+    budget = budget or default_budget()
+    options = [Profile(m, p, job_bytes(num_qubits, m, p) + extra_bytes)
+               for m, p in candidates(mixed, precision, allow_mps)]
+    for profile in options:
+        if profile.bytes <= budget:
+            return profile
+    cheapest = min(options, key=lambda p: p.bytes)
+    raise MemoryError(f"{num_qubits} qubits need {_size(cheapest.bytes)} even as a "
+                      f"{cheapest.precision}-precision {cheapest.method}, over the "
+                      f"{_size(budget)} budget (GROVER_MEMORY_MB)")
+
+# Probabilities saved by save_probabilities on an n-qubit register
+def snapshot_bytes(n, snapshots=1):
+    return snapshots * 2**n * 8
+
+# Snapshot labels 0 … k_max in consecutive runs, each of whose snapshots fit
+# the budget next to a state of state_bytes
+def snapshot_chunks(n, k_max, state_bytes=0, budget=None):
+    budget = budget or default_budget()
+    per_run = (budget - state_bytes) // snapshot_bytes(n)
+    if per_run < 1:
+        raise MemoryError(f"a {n}-qubit sweep needs {_size(state_bytes + snapshot_bytes(n))} "
+                          f"for its state and one snapshot, over the {_size(budget)} "
+                          f"budget (GROVER_MEMORY_MB)")
+    return [range(k, min(k + per_run, k_max + 1)) for k in range(0, k_max + 1, per_run)]
+
+# Widest job the budget allows with any of the candidates
+def max_qubits(budget=None, mixed=False, precision=None, allow_mps=False, limit=128):
+    budget = budget or default_budget()
+    cands = candidates(mixed, precision, allow_mps)
+    fits = [n for n in range(1, limit+1)
+            if any(job_bytes(n, m, p) <= budget for m, p in cands)]
+    return max(fits, default=0)
+
+def simulator_options(method, precision, budget=None):
+    options = dict(method=method, precision=precision,
+                   max_memory_mb=max(1, (budget or default_budget()) // 2**20))
+    if method == "matrix_product_state":
+        options["matrix_product_state_max_bond_dimension"] = MPS_BOND
+    return options
+
+# One simulator per (method, precision, budget), shared by every width that
+# selects it; the budget is read here, outside the cache key's default
+def simulator(method, precision, budget=None):
+    return _simulator(method, precision, budget or default_budget())
+
+@lru_cache(maxsize=None)
+def _simulator(method, precision, budget):
+    from qiskit_aer import AerSimulator
+    return AerSimulator(**simulator_options(method, precision, budget))
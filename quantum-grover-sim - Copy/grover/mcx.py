@@ -0,0 +1,94 @@
+# grover/mcx.py  –  multi-controlled X strategies for the oracle and diffuser builders
+#
+#   oracle = mcx_oracle("mcx", "vchain")                 # -> "mcx:vchain", n-2 clean ancillas
+#   oracle = mcx_oracle("esop", "relative-phase", 2)     # -> "esop:relative-phase=2"
+#   run_grover_prob(12, marked, k, oracle=oracle)
+#
+# A c-controlled X is built one of four ways:
+#   noancilla       qc.mcx as is, Qiskit's ancilla-free synthesis: O(c²) CX
+#   vchain          a Toffoli ladder ANDs the controls into c-2 clean ancillas,
+#                   one Toffoli hits the target, the ladder is uncomputed
+#   relative-phase  the same ladder from relative-phase Toffolis (RCCX, 3 CX
+#                   against 6), whose phases cancel on uncompute; only the
+#                   Toffoli on the target has to be exact
+#   vchain-dirty    c-2 ancillas in any state (Iten et al.): qubits the gate
+#                   leaves idle are borrowed first, then the extra wires
+# With a budget of fewer ancillas than the ladder needs, the clean strategies
+# use Khattar–Gidney's one- or two-ancilla constructions and vchain-dirty the
+# one-dirty-ancilla one, all still linear in c; a budget of 0 is noancilla.
+#
+# Every ancilla doubles a statevector, so for simulation the small budgets are
+# the useful ones: at n = 12 on the noise basis "mcx:vchain=2" cuts the oracle
+# from 716 to 66 CX on 15 qubits, where the full ladder gets the same count on
+# 23 qubits and runs 30× slower.  The noise-free "aer" backend executes MCX
+# natively, so there "noancilla" stays the fastest; the strategies pay off on
+# noisy engines and in resources.py's hardware-basis estimates.
+#
+# Like the noise levels in a noisy engine name, the strategy and budget travel
+# in the oracle name, so circuit-cache keys, result-store specs and runner
+# task keys tell them apart.  The ancillas are extra wires after the oracle's
+# own qubits (mcx_ancillas() of them) and the diffuser reuses them.  Nothing
+# here imports qiskit until a gate is built.
+
+MCX_STRATEGIES = ("noancilla", "vchain", "relative-phase", "vchain-dirty")
+
+def mcx_oracle(oracle, strategy="noancilla", ancillas=None):
+    if strategy not in MCX_STRATEGIES:
+        raise ValueError(f"unknown MCX strategy {strategy!r}, choose one of {MCX_STRATEGIES}")
+    if strategy == "noancilla":
+        return oracle
+    return f"{oracle}:{strategy}" + ("" if ancillas is None else f"={int(ancillas)}")
+
+# "esop:vchain=2" -> ("esop", "vchain", 2); the budget is None when not given
+def parse_oracle(oracle):
+    name, _, rest = oracle.partition(":")
+    strategy, _, budget = rest.partition("=")
+    return name, strategy or "noancilla", int(budget) if budget else None
+
+# Extra ancilla wires for an n-qubit search: the budget, else enough for the
+# full ladder of the widest MCX (the mcx oracle's, n controls)
+def mcx_ancillas(oracle, n):
+    _, strategy, budget = parse_oracle(oracle)
+    if strategy == "noancilla":
+        return 0
+    return max(0, n - 2) if budget is None else budget
+
+def _ladder(qc, controls, target, ancillas, toffoli):
+    steps = [(controls[0], controls[1], ancillas[0])]
+    steps += [(controls[i+2], ancillas[i], ancillas[i+1]) for i in range(len(controls) - 3)]
+    for step in steps:
+        toffoli(*step)
+    qc.ccx(controls[-1], ancillas[len(controls) - 3], target)
+    for step in reversed(steps):
+        toffoli(*step)
+
+# Qiskit's synthesised MCX circuits take (controls, target, ancillas) in that
+# order and only as many ancillas as they use
+def _compose(qc, circuit, wires):
+    qc.compose(circuit, wires[:circuit.num_qubits], inplace=True)
+
+# Appends an X on target controlled by every qubit in controls.  ancillas are
+# the clean wires the strategy may use; vchain-dirty also borrows idle qubits.
+def append_mcx(qc, controls, target, ancillas=(), strategy="noancilla"):
+    from qiskit.synthesis import (synth_mcx_1_clean_kg24, synth_mcx_2_clean_kg24,
+                                  synth_mcx_1_dirty_kg24, synth_mcx_n_dirty_i15)
+    controls, ancillas, c = list(controls), list(ancillas), len(controls)
+    if strategy == "vchain-dirty":
+        busy = set(controls) | {target}
+        ancillas = [q for q in range(qc.num_qubits) if q not in busy]
+    wires = controls + [target] + ancillas
+    if strategy == "noancilla" or c < 3 or not ancillas:
+        qc.mcx(controls, target)
+    elif len(ancillas) >= c - 2:
+        if strategy == "vchain":
+            _ladder(qc, controls, target, ancillas, qc.ccx)
+        elif strategy == "relative-phase":
+            _ladder(qc, controls, target, ancillas, qc.rccx)
+        else:
+            _compose(qc, synth_mcx_n_dirty_i15(c), wires)
+    elif strategy == "vchain-dirty":
+        _compose(qc, synth_mcx_1_dirty_kg24(c), wires)
+    elif len(ancillas) >= 2:
+        _compose(qc, synth_mcx_2_clean_kg24(c), wires)
+    else:
+        _compose(qc, synth_mcx_1_clean_kg24(c), wires)
@@ -0,0 +1,65 @@
+# grover/noise.py  –  gate and readout noise for Monte-Carlo trajectory runs
+#
+#   engine = noise_engine(depol=1e-3, depol2=1e-2, damping=1e-3, readout=1e-2)
+#   # -> "noisy:damping=0.001,depol=0.001,depol2=0.01,readout=0.01"
+#   run_grover_prob(12, marked, k, shots=2000, engine=engine)
+#
+# A statevector simulator given a noise model never forms a density matrix:
+# every shot is one trajectory with a Kraus operator drawn at each noisy gate,
+# so memory is one 2^n statevector per shot in flight instead of 4^n, and
+# shots run in parallel across cores.  Noise is attached to NOISE_BASIS, which
+# circuits are transpiled to first (rz is virtual and stays noiseless).
+#
+# The noise settings travel inside the engine name, so result-store specs and
+# runner task keys tell noise levels apart and worker processes can rebuild
+# the backend from the name alone.
+
+from functools import lru_cache
+from .execution import simulator_options, default_budget
+
+NOISE_BASIS = ["cx", "rz", "sx", "x"]
+NOISE_PARAMS = ("depol", "depol2", "damping", "readout")
+
+# depol / depol2: depolarizing probability per 1- / 2-qubit gate; damping:
+# amplitude-damping γ per 1-qubit gate; readout: symmetric bit-flip on measure
+def noise_model(depol=0.0, depol2=0.0, damping=0.0, readout=0.0):
+    from qiskit_aer.noise import (NoiseModel, ReadoutError, amplitude_damping_error,
+                                  depolarizing_error)
+    nm = NoiseModel(basis_gates=NOISE_BASIS)
+    one_qubit = None
+    if depol:
+        one_qubit = depolarizing_error(depol, 1)
+    if damping:
+        amp = amplitude_damping_error(damping)
+        one_qubit = amp if one_qubit is None else one_qubit.compose(amp)
+    if one_qubit is not None:
+        nm.add_all_qubit_quantum_error(one_qubit, ["sx", "x"])
+    if depol2:
+        nm.add_all_qubit_quantum_error(depolarizing_error(depol2, 2), ["cx"])
+    if readout:
+        nm.add_all_qubit_readout_error(ReadoutError([[1-readout, readout], [readout, 1-readout]]))
+    return nm
+
+def noise_engine(**noise):
+    unknown = set(noise) - set(NOISE_PARAMS)
+    if unknown:
+        raise ValueError(f"unknown noise parameters {sorted(unknown)}")
+    return "noisy:" + ",".join(f"{k}={float(v)!r}" for k, v in sorted(noise.items()) if v)
+
+def is_noise_engine(engine):
+    return engine == "noisy" or engine.startswith("noisy:")
+
+def parse_noise_engine(engine):
+    _, _, params = engine.partition(":")
+    return {k: float(v) for k, v in (p.split("=") for p in params.split(",") if p)}
+
+# method: statevector for trajectories, or density_matrix (see execution.select);
+# cached per budget like execution.simulator
+def noisy_backend(engine, method="statevector", precision="double", budget=None):
+    return _noisy_backend(engine, method, precision, budget or default_budget())
+
+@lru_cache(maxsize=None)
+def _noisy_backend(engine, method, precision, budget):
+    from qiskit_aer import AerSimulator
+    return AerSimulator(**simulator_options(method, precision, budget), max_parallel_shots=0,
+                        noise_model=noise_model(**parse_noise_engine(engine)))
@@ -0,0 +1,93 @@
+# grover/oracles.py  –  ancilla-free phase oracles, drop-in alternatives to build_oracle
+#
+# Every builder has build_oracle's signature, builder(marked, n, strategy,
+# ancillas) -> Gate, but acts on the n data qubits only: a marked state gets
+# its -1 from a multi-controlled Z instead of phase kickback on an ancilla in
+# |->.  strategy picks how each MCX is built, using `ancillas` extra wires
+# after the data qubits (mcx.py).
+#
+#   build_phase_oracle  — one MCZ per marked state (M MCX gates)
+#   build_esop_oracle   — marked states merged into shared cubes first, so
+#                         list(range(M)) with M = 2^m is a single MCZ on n-m qubits
+#   build_range_oracle  — a contiguous marked set lo..hi-1 as two integer
+#                         comparators; the exception, it keeps the |-> ancilla
+
+import math
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import IntegerComparatorGate
+from .mcx import append_mcx
+
+# A cube is (value, care): it covers every x with x & care == value & care.
+def _cube_circuit(cubes, n, strategy="noancilla", ancillas=0):
+    qc = QuantumCircuit(n + ancillas)
+    for value, care in cubes:
+        fixed = [q for q in range(n) if (care >> q) & 1]
+        zeros = [q for q in fixed if not (value >> q) & 1]
+        if not fixed:                  # the cube is every state: global -1
+            qc.global_phase += math.pi
+            continue
+        if zeros: qc.x(zeros)
+        if len(fixed) == 1:
+            qc.z(fixed[0])
+        else:
+            qc.h(fixed[-1])
+            append_mcx(qc, fixed[:-1], fixed[-1], range(n, n + ancillas), strategy)
+            qc.h(fixed[-1])
+        if zeros: qc.x(zeros)
+    return qc
+
+def build_phase_oracle(marked, n, strategy="noancilla", ancillas=0):
+    full = 2**n - 1
+    return _cube_circuit([(s, full) for s in marked], n, strategy, ancillas).to_gate(label="O")
+
+# Merge disjoint cubes that differ in exactly one cared-about bit.  The union
+# of two such cubes is itself a cube and the cover stays disjoint, so XOR-ing
+# the cube phases (an ESOP) is the same as OR-ing them.
+def esop_cubes(marked, n):
+    cubes = {(s, 2**n - 1) for s in set(marked)}
+    merged = True
+    while merged:
+        merged, out, used = False, set(), set()
+        for value, care in sorted(cubes):
+            if (value, care) in used:
+                continue
+            for q in range(n):
+                bit = 1 << q
+                partner = (value ^ bit, care)
+                if care & bit and partner in cubes and partner not in used:
+                    used |= {(value, care), partner}
+                    out.add((value & ~bit, care & ~bit))
+                    merged = True
+                    break
+            else:
+                out.add((value, care))
+        cubes = out
+    return sorted(cubes)
+
+def build_esop_oracle(marked, n, strategy="noancilla", ancillas=0):
+    return _cube_circuit(esop_cubes(marked, n), n, strategy, ancillas).to_gate(label="O")
+
+# [x >= lo] XOR [x >= hi] is 1 exactly on lo <= x < hi, so kicking both
+# comparator results into the same |-> ancilla (qubit n) marks the range
+# without a work qubit or an AND.  Cost is independent of M, unlike the above.
+# It has no MCX, so strategy is unused; the ancilla wires are only carried
+# for the diffuser.
+def build_range_oracle(marked, n, strategy="noancilla", ancillas=0):
+    lo, hi = min(marked), max(marked) + 1
+    if hi - lo != len(set(marked)):
+        raise ValueError("range oracle needs a contiguous marked set")
+    qc = QuantumCircuit(n + 1 + ancillas)
+    qc.h(n)
+    for bound in (lo, hi):
+        if 0 < bound < 2**n:           # x >= 0 is a global phase, x >= 2^n never holds
+            qc.append(IntegerComparatorGate(n, bound, geq=True), range(n + 1))
+    if lo == 0:
+        qc.global_phase += math.pi
+    qc.h(n)
+    return qc.to_gate(label="O")
+
+# Gate and MCX count of a built oracle (or any gate with a definition)
+def oracle_cost(gate):
+    ops = gate.definition.count_ops()
+    return {"qubits": gate.num_qubits, "gates": sum(ops.values()),
+            "mcx": ops.get("mcx", 0), "depth": gate.definition.depth()}
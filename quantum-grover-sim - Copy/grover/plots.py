@@ -0,0 +1,166 @@
+# grover/plots.py  –  the figures of grover_sim.py / `python -m grover plot`
+#
+# Each plot writes its PNG to the working directory.  Only the plot
+# subcommand imports this module, and with it matplotlib.
+
+import math
+import random
+from math import sqrt
+import numpy as np
+import matplotlib.pyplot as plt
+from .stats import wilson_interval
+from .profiling import as_sweep
+from .noise import is_noise_engine
+from .simulate import (oscillation_curve, scaling_point, unknown_M_point, bbht_point,
+                       sweep_grover_batch, run_grover_batch, run_grover_prob,
+                       search_grover_unknown_M)
+
+# The plots below take runner=partial(run_tasks, ...) to fan their grid points
+# out to worker processes (or, with compute=False, to read them back from the
+# store only); without one they run in-process as batched jobs.
+
+# 4 ▸ Plot A — oscillations
+@as_sweep
+def plot_oscillations(engine="aer", oracle="mcx", runner=None):
+    n, shots = 8, 4096
+    plt.figure(figsize=(7,4))
+    Ms = [1,4,16]
+    if runner:
+        curves = runner(oscillation_curve, [dict(n=n, M=M, shots=shots, engine=engine, oracle=oracle)
+                                            for M in Ms])
+    else:
+        markeds = [random.sample(range(2**n), M) for M in Ms]
+        curves = sweep_grover_batch([(n, marked, 16) for marked in markeds], shots, engine, oracle)
+    for M, probs in zip(Ms, curves):
+        line, = plt.plot(range(17), probs, 'o-', label=f"M = {M}")
+        if is_noise_engine(engine):   # 95 % Wilson band over the trajectories
+            lo, hi = zip(*(wilson_interval(round(p*shots), shots) for p in probs))
+            plt.fill_between(range(17), lo, hi, color=line.get_color(), alpha=0.2)
+    plt.xlabel("Grover iterations k")
+    plt.ylabel("Success probability")
+    plt.title("Grover amplification (N=256)" + (", noisy" if is_noise_engine(engine) else ""))
+    plt.ylim(0,1.05); plt.legend()
+    plt.tight_layout(); plt.savefig("oscillations.png", dpi=300); plt.close()
+
+# 5 ▸ Plot B — optimized scaling (M = 1)
+@as_sweep
+def plot_scaling(engine="aer", n_max=10, oracle="mcx", runner=None):
+    shots = 16384
+    marked = [0]  # deterministic
+    records = []
+    if runner:
+        ns = range(4, n_max+1)
+        bests = runner(scaling_point, [dict(n=n, M=1, shots=shots, engine=engine, oracle=oracle)
+                                       for n in ns])
+        records = [(sqrt(2**n), best) for n, best in zip(ns, bests)]
+    else:
+        specs = []
+        for n in range(4, n_max+1):
+            k0 = math.ceil((math.pi/4)*math.sqrt(2**n))
+            specs += [(n, marked, k, shots) for k in [max(1, k0-1), k0, k0+1]]
+        probs = run_grover_batch(specs, engine, oracle)  # every n, every candidate, one job
+        for i in range(0, len(specs), 3):
+            best = max(range(i, i+3), key=lambda j: probs[j])
+            records.append((sqrt(2**specs[i][0]), specs[best][2]))
+    x,y = zip(*records)
+    slope, intercept = np.polyfit(np.log10(x), np.log10(y),1)
+    fit = 10**intercept * np.array(x)**slope
+    plt.figure(figsize=(5,4))
+    plt.loglog(x,y,'o',label="data")
+    plt.loglog(x,fit,'--',label=f"slope≈{slope:.2f}")
+    plt.xlabel(r"$\sqrt{N}$ (log)"); plt.ylabel(r"$k_{\rm opt}$ (log)")
+    plt.title("Optimized Grover scaling (M=1)")
+    plt.grid(True, which='both', ls='--'); plt.legend()
+    plt.tight_layout(); plt.savefig("scaling.png",dpi=300); plt.close()
+
+# 6 ▸ Plot C — optimized scaling for fixed M
+@as_sweep
+def plot_scaling_fixed_M(M, engine="aer", n_max=14, oracle="mcx", runner=None):
+    shots = 16384
+    marked = list(range(M))
+    ns = range(4, n_max+1)
+    if runner:
+        bests = runner(scaling_point, [dict(n=n, M=M, shots=shots, engine=engine, oracle=oracle)
+                                       for n in ns])
+    else:
+        k0s = [math.ceil((math.pi/4)*math.sqrt(2**n/M)) for n in ns]
+        curves = sweep_grover_batch([(n, marked, k0+1) for n, k0 in zip(ns, k0s)], shots, engine, oracle)
+        bests = [max([max(1, k0-1), k0, k0+1], key=lambda k: probs[k])
+                 for k0, probs in zip(k0s, curves)]
+    records = [(sqrt(2**n/M), best) for n, best in zip(ns, bests)]
+    x,y = zip(*records)
+    slope, intercept = np.polyfit(np.log10(x), np.log10(y),1)
+    fit = 10**intercept * np.array(x)**slope
+    plt.figure(figsize=(5,4))
+    plt.loglog(x,y,'o',label="data")
+    plt.loglog(x,fit,'--',label=f"slope≈{slope:.2f}")
+    plt.xlabel(r"$\sqrt{N/M}$ (log)"); plt.ylabel(r"$k_{\rm opt}$ (log)")
+    plt.title(f"Optimized Grover scaling (M={M})")
+    plt.grid(True, which='both', ls='--'); plt.legend()
+    plt.tight_layout(); plt.savefig(f"scaling_M{M}.png",dpi=300); plt.close()
+
+# 7 ▸ Circuit diagram example
+def save_circuit_diagram():
+    from .circuits import grover_circuit
+    qc = grover_circuit(4, [3], k=2)
+    fig = qc.draw(output="mpl", fold=-1, idle_wires=False)
+    fig.savefig("circuit_demo.png", dpi=300, bbox_inches="tight"); plt.close()
+
+# 8 ▸ Plot D — unknown-M summary.  The scan ends at a fixed k, so its success
+#     probability there is charted against random guessing; BBHT ends at a
+#     random j, so it is charted by its cost instead (plot_bbht_summary)
+@as_sweep
+def plot_unknown_M_summary(engine="aer", oracle="mcx", runner=None, method="scan", adaptive=False):
+    if method == "bbht":
+        return plot_bbht_summary(engine, oracle, runner)
+    n, shots = 8, 4096
+    N=2**n; results=[]
+    if runner:
+        points = runner(unknown_M_point, [dict(n=n, M=M, shots=shots, engine=engine, oracle=oracle,
+                                               method=method, adaptive=adaptive) for M in [1,4,16]])
+        results = [(M,k,calls,prob) for M, (k,calls,prob) in zip([1,4,16], points) if k is not None]
+    else:
+        for M in [1,4,16]:
+            marked = list(range(M))
+            k,calls = search_grover_unknown_M(n, marked, shots=shots, engine=engine, oracle=oracle,
+                                              method=method, adaptive=adaptive)
+            if k is not None:
+                prob = run_grover_prob(n, marked, k, shots, engine, oracle)
+                results.append((M,k,calls,prob))
+    Ms, ks, calls, ps = zip(*results)
+    rand=[M/N for M in Ms]
+    x=np.arange(len(Ms))
+    fig,ax=plt.subplots(figsize=(6,4))
+    ax.bar(x-0.15, ps, 0.3, label="Grover")
+    ax.bar(x+0.15, rand, 0.3, label="Random", alpha=0.6)
+    for i,k in enumerate(ks):
+        ax.text(x[i], ps[i]+0.02, f"k={k}\n{calls[i]} calls", ha="center", fontsize=8)
+    ax.set_xticks(x); ax.set_xticklabels([f"M={M}" for M in Ms])
+    ax.set_ylim(0,1.1)
+    ax.set_ylabel("Success probability")
+    ax.set_title(f"Unknown-M Grover ({method}) vs. Random")
+    ax.legend()
+    plt.tight_layout(); plt.savefig("unknown_M_summary.png", dpi=300); plt.close()
+
+# Mean oracle calls over `trials` BBHT searches against √(N/M), with the
+# known-M optimum (π/4)·√(N/M) for reference and each point's success rate
+def plot_bbht_summary(engine="aer", oracle="mcx", runner=None, trials=100):
+    n, Ms = 8, [1, 4, 16]
+    N = 2**n
+    tasks = [dict(n=n, M=M, trials=trials, engine=engine, oracle=oracle) for M in Ms]
+    points = runner(bbht_point, tasks) if runner else [bbht_point(**t) for t in tasks]
+    x = np.array([sqrt(N/M) for M in Ms])
+    mean = np.array([np.mean(calls) for calls, _ in points])
+    sem = np.array([np.std(calls, ddof=1)/sqrt(len(calls)) for calls, _ in points])
+    fig, ax = plt.subplots(figsize=(6,4))
+    ax.errorbar(x, mean, yerr=sem, fmt="o", capsize=3, label=f"BBHT, mean of {trials}")
+    ax.plot(x, (math.pi/4)*x, "--", label="Known-M optimum (π/4)·√(N/M)")
+    for xi, yi, M, (_, found) in zip(x, mean, Ms, points):
+        ax.annotate(f"M={M}\n{found}/{trials} found", (xi, yi), textcoords="offset points",
+                    xytext=(6, 6), fontsize=8)
+    ax.set_xlim(0, 1.3*x.max())          # room for the labels
+    ax.set_xlabel("√(N/M)")
+    ax.set_ylabel("Oracle calls")
+    ax.set_title(f"Unknown-M Grover (BBHT), N = {N}")
+    ax.legend()
+    plt.tight_layout(); plt.savefig("unknown_M_summary.png", dpi=300); plt.close()
@@ -0,0 +1,184 @@
+# grover/profiling.py  –  opt-in per-stage timing for the Grover pipeline
+#
+#   GROVER_PROFILE=1 python -m grover plot           # report after every sweep
+#   GROVER_PROFILE=prof/ python -m grover plot       # ... also exported to prof/
+#
+#   with profiling(export="prof/", cprofile=True) as prof:
+#       plot_scaling_fixed_M(16)                 # prints its report when done
+#   prof.records                                 # one dict per stage call
+#
+# grover.simulate wraps its stages in stage(): oracle and diffuser construction,
+# transpile, assembling the k-iteration circuit, backend.run and decoding
+# counts.  Each record holds the duration, circuit sizes and, for runs, Aer's
+# own metadata (time taken, threads and shots in parallel, method, memory).
+# Functions decorated with @as_point (run_grover_prob, the batched sweeps) are
+# points: with cprofile=True the outermost call runs under cProfile and the
+# `keep` slowest are dumped as .prof files (snakeviz or flameprof turn them
+# into flame graphs).  @as_sweep functions (the plots) print the aggregated
+# report for their own records when they return, and export it if asked to.
+#
+# Disabled, stage() returns a shared null context yielding None, so the hooks
+# cost a function call.  Records are kept per process: grid points run
+# through runner.py workers are not collected.
+
+import os
+import json
+import time
+import cProfile
+import functools
+from pathlib import Path
+from contextlib import contextmanager, nullcontext
+
+_NULL = nullcontext()
+
+class Profiler:
+    def __init__(self, export=None, cprofile=False, keep=5):
+        self.export_dir = Path(export) if export else None
+        self.cprofile, self.keep = cprofile, keep
+        self.records = []                  # {"stage", "seconds", "point", ...}
+        self.points = []                   # (seconds, label, cProfile.Profile or None)
+        self._point = None
+
+    @contextmanager
+    def stage(self, name, info):
+        record = {"stage": name, "point": self._point, **info}
+        t0 = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - t0
+            self.records.append(record)
+
+    @contextmanager
+    def point(self, label):
+        if self._point is not None:        # nested call: part of the enclosing point
+            yield
+            return
+        self._point = label
+        prof = cProfile.Profile() if self.cprofile else None
+        t0 = time.perf_counter()
+        try:
+            if prof:
+                prof.enable()
+            yield
+        finally:
+            if prof:
+                prof.disable()
+            self.points.append((time.perf_counter() - t0, label, prof))
+            if prof:                       # only the `keep` slowest profiles are kept
+                self.points.sort(key=lambda p: -p[0])
+                del self.points[self.keep:]
+            self._point = None
+
+    # {stage: {calls, seconds, mean, max, share}} over the records since `start`
+    def summary(self, start=0):
+        records = self.records[start:]
+        total = sum(r["seconds"] for r in records) or 1.0
+        out = {}
+        for r in records:
+            s = out.setdefault(r["stage"], {"calls": 0, "seconds": 0.0, "max": 0.0})
+            s["calls"] += 1
+            s["seconds"] += r["seconds"]
+            s["max"] = max(s["max"], r["seconds"])
+        for s in out.values():
+            s["mean"], s["share"] = s["seconds"]/s["calls"], s["seconds"]/total
+        return dict(sorted(out.items(), key=lambda kv: -kv[1]["seconds"]))
+
+    def report(self, label="profile", start=0):
+        summary = self.summary(start)
+        print(f"{label}: {'stage':<14}{'calls':>7}{'total s':>10}{'mean ms':>10}"
+              f"{'max ms':>10}{'share':>8}")
+        for name, s in summary.items():
+            print(f"{'':<{len(label)+2}}{name:<14}{s['calls']:>7}{s['seconds']:>10.3f}"
+                  f"{s['mean']*1e3:>10.2f}{s['max']*1e3:>10.2f}{s['share']:>8.1%}")
+        slowest = sorted(self.points, key=lambda p: -p[0])[:self.keep]
+        if slowest:
+            print(f"{'':<{len(label)+2}}slowest: " +
+                  ", ".join(f"{lbl} {sec:.2f}s" for sec, lbl, _ in slowest))
+        if self.export_dir:
+            self.export(label, start)
+        return summary
+
+    def export(self, label="profile", start=0):
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        safe = "".join(c if c.isalnum() or c in "-_=" else "_" for c in label)
+        data = {"summary": self.summary(start), "records": self.records[start:]}
+        (self.export_dir / f"{safe}.json").write_text(json.dumps(data, indent=1, default=str))
+        for i, (seconds, lbl, prof) in enumerate(sorted(self.points, key=lambda p: -p[0])):
+            if prof is not None:
+                prof.dump_stats(self.export_dir / f"{safe}.slowest{i}.prof")
+
+def _from_env():
+    value = os.environ.get("GROVER_PROFILE", "")
+    if value in ("", "0"):
+        return None
+    return Profiler(export=None if value == "1" else value)
+
+_active = _from_env()
+
+@contextmanager
+def profiling(export=None, cprofile=False, keep=5):
+    global _active
+    previous, _active = _active, Profiler(export, cprofile, keep)
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+def stage(name, **info):
+    return _NULL if _active is None else _active.stage(name, info)
+
+def point(label):
+    return _NULL if _active is None else _active.point(label)
+
+@contextmanager
+def sweep(label):
+    if _active is None:
+        yield
+        return
+    start = len(_active.records)
+    _active.points = []
+    try:
+        yield
+    finally:
+        _active.report(label, start)
+
+def _label(fn, args):
+    shown = [repr(a) for a in args if isinstance(a, (int, float, str))]
+    return f"{fn.__name__}({', '.join(shown)})"
+
+# Every call of the decorated function is a point / a reported sweep
+def as_point(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _active is None:
+            return fn(*args, **kwargs)
+        with _active.point(_label(fn, args)):
+            return fn(*args, **kwargs)
+    return wrapper
+
+def as_sweep(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with sweep(_label(fn, args)):
+            return fn(*args, **kwargs)
+    return wrapper
+
+# Circuit sizes for a stage record, summed over a batch (widest / deepest one)
+def circuit_info(circuits):
+    circuits = circuits if isinstance(circuits, list) else [circuits]
+    return {"circuits": len(circuits), "qubits": max(qc.num_qubits for qc in circuits),
+            "size": sum(qc.size() for qc in circuits),
+            "depth": max(qc.depth() for qc in circuits)}
+
+# The parts of an Aer result's metadata worth keeping per run
+def aer_info(result):
+    experiments = [r.metadata for r in result.results]
+    return {"aer_seconds": result.time_taken,
+            "aer_execute_seconds": result.metadata.get("time_taken_execute"),
+            "parallel_experiments": result.metadata.get("parallel_experiments"),
+            "threads": max((m.get("parallel_state_update", 1) for m in experiments), default=None),
+            "parallel_shots": max((m.get("parallel_shots", 1) for m in experiments), default=None),
+            "method": experiments[0].get("method") if experiments else None,
+            "required_memory_mb": max((m.get("required_memory_mb", 0) for m in experiments),
+                                      default=None)}
@@ -0,0 +1,65 @@
+# grover/readout.py  –  vectorised counts decoding against the marked set
+#
+# Counts are handled as two integer columns, outcomes (basis-state index) and
+# counts, and membership is a lookup in a cached boolean mask over all 2^n
+# states (np.isin on the sorted marked indices above MASK_MAX_QUBITS).  This
+# replaces parsing every bitstring key and scanning the marked list per key.
+# Masks are kept least recently used first up to MASK_CACHE_BYTES in all, so
+# a few wide ones cannot pin gigabytes.
+#
+#   outcomes, counts = counts_arrays(result.data(0)["counts"])   # Aer hex keys
+#   marked_hits(outcomes, counts, n, marked) / shots
+
+from collections import OrderedDict
+import numpy as np
+
+MASK_MAX_QUBITS = 26                       # a 64 MiB mask; beyond that use np.isin
+MASK_CACHE_BYTES = 2**27                   # two of those, or 128 at n = 20
+
+_masks = OrderedDict()                     # (n, marked) -> mask
+
+def _mask(n, marked):
+    key = (n, marked)
+    if key in _masks:
+        _masks.move_to_end(key)
+        return _masks[key]
+    mask = np.zeros(2**n, dtype=bool)
+    mask[list(marked)] = True
+    mask.flags.writeable = False           # shared between callers
+    _masks[key] = mask
+    size = sum(m.nbytes for m in _masks.values())
+    while size > MASK_CACHE_BYTES and len(_masks) > 1:
+        size -= _masks.popitem(last=False)[1].nbytes
+    return mask
+
+# The marked set as sorted distinct ints, each a state of the n-qubit register
+def marked_states(n, marked):
+    states = tuple(sorted(set(int(x) for x in marked)))
+    if states and not (0 <= states[0] and states[-1] < 2**n):
+        bad = states[0] if states[0] < 0 else states[-1]
+        raise ValueError(f"marked state {bad} is outside the {n}-qubit register (0 … {2**n - 1})")
+    return states
+
+def marked_mask(n, marked):
+    return _mask(n, marked_states(n, marked))
+
+def is_marked(outcomes, n, marked):
+    outcomes = np.asarray(outcomes, dtype=np.int64)
+    if n <= MASK_MAX_QUBITS:
+        return marked_mask(n, marked)[outcomes]
+    return np.isin(outcomes, np.array(marked_states(n, marked), dtype=np.int64))
+
+def marked_hits(outcomes, counts, n, marked):
+    return int(np.asarray(counts)[is_marked(outcomes, n, marked)].sum())
+
+# Accepts Aer's raw hex keys ("0x1f"), get_counts() bitstrings or plain ints
+def counts_arrays(counts):
+    keys = list(counts)
+    if keys and isinstance(keys[0], str):
+        base = 16 if keys[0].startswith("0x") else 2
+        keys = (int(key.replace(" ", ""), base) for key in keys)
+    outcomes = np.fromiter(keys, dtype=np.int64, count=len(counts))
+    return outcomes, np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+
+def to_bitstrings(outcomes, counts, n):
+    return {format(int(x), f"0{n}b"): int(c) for x, c in zip(outcomes, counts)}
@@ -0,0 +1,118 @@
+# grover/result_store.py  –  content-addressed on-disk store for simulation outputs
+#
+# An entry is keyed by the SHA-256 of its experiment spec (a JSON-able dict:
+# n, marked, k, shots, seed, engine, oracle, backend options, …) and holds a
+# handful of NumPy arrays in one compressed .npz.  Entries are touched on every
+# read, so max_bytes evicts the least recently used ones first.  The store's
+# size is tracked across puts rather than summed on each, and resummed every
+# RESCAN_PUTS puts to count what other processes (runner workers) have written.
+#
+#   store = ResultStore("results/", max_bytes=2**30)
+#   store.put(spec, outcomes=..., counts=...);  store.get(spec)["counts"]
+#   store.export("run_a.jsonl")    # one line per entry, for diffing two runs
+
+import os
+import json
+import hashlib
+from pathlib import Path
+import numpy as np
+
+RESCAN_PUTS = 64
+
+def spec_key(spec):
+    canon = json.dumps(spec, sort_keys=True, separators=(",", ":"), default=_plain)
+    return hashlib.sha256(canon.encode()).hexdigest()
+
+def _plain(x):
+    return x.item() if isinstance(x, np.generic) else str(x)
+
+class ResultStore:
+    def __init__(self, root, max_bytes=None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._total, self._puts = None, 0  # bytes as of the last scan, plus puts since
+
+    def _path(self, spec):
+        key = spec_key(spec)
+        return self.root / key[:2] / f"{key}.npz"
+
+    def __contains__(self, spec):
+        return self._path(spec).exists()
+
+    def get(self, spec):
+        path = self._path(spec)
+        try:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files if name != "_spec"}
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)                 # mark as recently used
+        except FileNotFoundError:          # evicted by another process meanwhile
+            pass
+        return arrays
+
+    def put(self, spec, **arrays):
+        path = self._path(spec)
+        path.parent.mkdir(exist_ok=True)
+        # a name the *.npz scans skip, so a half-written entry is never counted,
+        # exported or evicted; written through a file object, since savez
+        # appends .npz to a bare name
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        spec_json = json.dumps(spec, sort_keys=True, default=_plain)
+        with open(tmp, "wb") as f:
+            np.savez_compressed(f, _spec=np.array(spec_json), **arrays)
+        replaced = path.stat().st_size if self.max_bytes and path.exists() else 0
+        os.replace(tmp, path)
+        if self.max_bytes:
+            self._puts += 1
+            if self._total is None or self._puts >= RESCAN_PUTS:
+                self._total, self._puts = self.size_bytes(), 0
+            else:
+                self._total += path.stat().st_size - replaced
+            if self._total > self.max_bytes:
+                self.evict()
+
+    # JSON-able values (task results) ride along as a 0-d string array
+    def get_json(self, spec):
+        arrays = self.get(spec)
+        return None if arrays is None else json.loads(str(arrays["json"]))
+
+    def put_json(self, spec, value):
+        self.put(spec, json=np.array(json.dumps(value, default=_plain)))
+
+    # (path, stat) per entry, oldest first; entries removed mid-scan are skipped
+    def _scan(self):
+        stats = []
+        for p in self.root.glob("*/*.npz"):
+            try:
+                stats.append((p, p.stat()))
+            except FileNotFoundError:
+                pass
+        return sorted(stats, key=lambda e: e[1].st_mtime)
+
+    def entries(self):
+        return [p for p, _ in self._scan()]
+
+    def size_bytes(self):
+        return sum(st.st_size for _, st in self._scan())
+
+    def evict(self, max_bytes=None):
+        max_bytes = max_bytes or self.max_bytes
+        entries = self._scan()
+        total = sum(st.st_size for _, st in entries)
+        while entries and total > max_bytes:
+            oldest, st = entries.pop(0)
+            total -= st.st_size
+            oldest.unlink(missing_ok=True)
+        self._total, self._puts = total, 0
+
+    def export(self, path):
+        with open(path, "w") as f:
+            for entry in self.entries():
+                with np.load(entry) as data:
+                    record = {"key": entry.stem, "spec": json.loads(str(data["_spec"]))}
+                    record.update({name: data[name].tolist() for name in data.files
+                                   if name != "_spec"})
+                f.write(json.dumps(record, default=_plain) + "\n")
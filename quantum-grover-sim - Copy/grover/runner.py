@@ -0,0 +1,139 @@
+# grover/runner.py  –  parallel, resumable grid runner with per-task seed streams
+#
+#   run_tasks(fn, tasks, workers=8, store="results/")
+#
+# Each task is a kwargs dict for fn, a module-level function that takes a
+# seed= keyword and returns something JSON-serialisable.  A task's seed is
+# derived from the base seed and a hash of (fn, kwargs), so results do not
+# depend on worker count, completion order or which host ran the task.
+#
+# Finished tasks are checkpointed in a ResultStore (keyed by fn, task and seed)
+# and skipped on the next call, so an interrupted sweep resumes where it
+# stopped; compute=False only reads the store, which is how the plotting stage
+# redraws figures without simulating.  With queue_dir
+# set to a shared directory, several hosts can call run_tasks on the same grid:
+# each claims tasks through O_EXCL lock files and waits for the others' results.
+# A run that dies leaves its locks behind.  A lock is taken over when its
+# hostname:pid names a process on this host that no longer exists, or when it
+# is older than stale_after seconds (for hosts that cannot be checked), and a
+# waiting host computes any task whose lock it takes over itself.
+
+import os
+import json
+import time
+import socket
+import hashlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+from .result_store import ResultStore, spec_key
+
+def task_key(fn, task):
+    spec = json.dumps({"fn": fn.__qualname__, "task": task},
+                      sort_keys=True, default=str)
+    return hashlib.sha256(spec.encode()).hexdigest()[:32]
+
+def task_seed(seed, key):
+    return int(np.random.SeedSequence([seed, int(key[:16], 16)]).generate_state(1)[0])
+
+# True if the lock's owner is a process of this host that has exited
+def _owner_dead(lock):
+    try:
+        host, _, pid = lock.read_text().rpartition(":")
+    except FileNotFoundError:
+        return False
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:                # alive, owned by another user
+        return False
+    return False
+
+def _stale(lock, stale_after):
+    try:
+        age = time.time() - lock.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return _owner_dead(lock) or bool(stale_after and age > stale_after)
+
+def _claim(queue_dir, key, stale_after, retry=True):
+    lock = queue_dir / f"{key}.lock"
+    try:
+        fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        if retry and _stale(lock, stale_after):
+            lock.unlink(missing_ok=True)   # owner gone; try once more
+            return _claim(queue_dir, key, stale_after, retry=False)
+        return False
+    os.write(fd, f"{socket.gethostname()}:{os.getpid()}".encode())
+    os.close(fd)
+    return True
+
+def run_tasks(fn, tasks, workers=None, store=None, seed=42, queue_dir=None,
+              poll=5.0, stale_after=None, compute=True):
+    tasks = list(tasks)
+    seeds = [task_seed(seed, task_key(fn, t)) for t in tasks]
+    specs = [{"fn": fn.__qualname__, "task": t, "seed": s} for t, s in zip(tasks, seeds)]
+    keys = [spec_key(spec) for spec in specs]
+    queue_dir = Path(queue_dir) if queue_dir else None
+    if queue_dir:
+        queue_dir.mkdir(parents=True, exist_ok=True)
+    store = store or queue_dir
+    if store is not None and not isinstance(store, ResultStore):
+        store = ResultStore(store)
+
+    results, have, todo = [None]*len(tasks), set(), []
+    for i in range(len(tasks)):
+        stored = store.get_json(specs[i]) if store is not None else None
+        if stored is not None:
+            results[i] = stored["result"]
+            have.add(i)
+        else:
+            todo.append(i)
+    if todo and not compute:
+        raise LookupError(f"{len(todo)} of {len(tasks)} {fn.__qualname__} grid points "
+                          "are not in the store; run the sweep first")
+
+    def finish(i, result):
+        results[i] = result
+        have.add(i)
+        if store is not None:
+            store.put_json(specs[i], {"result": result})
+
+    claimable = lambda i: not queue_dir or _claim(queue_dir, keys[i], stale_after)
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        for i in todo:
+            if claimable(i):
+                finish(i, fn(**tasks[i], seed=seeds[i]))
+    else:
+        # claim lazily, keeping at most `workers` tasks in flight, so other
+        # hosts sharing queue_dir get their share of the grid
+        with ProcessPoolExecutor(workers) as pool:
+            pending, queue = {}, list(todo)
+            while queue or pending:
+                while queue and len(pending) < workers:
+                    i = queue.pop(0)
+                    if claimable(i):
+                        pending[pool.submit(fn, **tasks[i], seed=seeds[i])] = i
+                if pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in done:
+                        finish(pending.pop(fut), fut.result())
+
+    # tasks claimed by other hosts: wait for their checkpoints, and take over
+    # the ones whose owner has gone away
+    for i in todo:
+        while i not in have:
+            stored = store.get_json(specs[i])
+            if stored is not None:
+                results[i] = stored["result"]
+                have.add(i)
+            elif claimable(i):
+                finish(i, fn(**tasks[i], seed=seeds[i]))
+            else:
+                time.sleep(poll)
+    return results
@@ -0,0 +1,428 @@
+# grover/simulate.py  –  Grover runs and sweeps on the aer, numpy, analytic and noisy engines
+#
+#   run_grover_prob(10, [3], 25, engine="analytic", seed=1)
+#   run_grover_prob_ci(12, [0, 7], 17, engine=noise_engine(depol2=0.01))
+#   sweep_grover_probs(8, [5], 16, shots=None, engine="numpy")
+#   search_grover_bbht(10, [42], seed=0)            # (x, j, oracle calls)
+#
+# Importing this module costs numpy and the small helper modules only:
+# qiskit comes in with the first compiled circuit and qiskit_aer with the
+# first backend (execution.py, noise.py), so the numpy and analytic engines
+# never load either.  Nothing is seeded or opened at import; the result store
+# named by GROVER_STORE is opened on first use.
+
+import os
+import math
+from math import sqrt
+import numpy as np
+from .circuit_cache import CircuitCache
+from .result_store import ResultStore
+from .stats import sequential_threshold_test, wilson_interval
+from .execution import (select, simulator, max_qubits, job_bytes, default_budget,
+                        snapshot_bytes, snapshot_chunks)
+from .profiling import stage, as_point, circuit_info, aer_info
+from .noise import is_noise_engine, parse_noise_engine, noisy_backend
+from .mcx import parse_oracle, mcx_ancillas
+from .readout import marked_mask, marked_hits, counts_arrays, to_bitstrings
+from .engines import (make_rng, numpy_counts, numpy_prob, numpy_sweep,
+                      analytic_counts, analytic_prob, analytic_sweep)
+
+# 2 ▸ Execution helpers — every engine returns integer (outcomes, counts)
+#     columns, decoded against a cached marked mask (readout.py)
+
+# Oracle and diffuser are transpiled once per (n, marked set, backend) and
+# k copies are stitched together with compose, so no k-iteration circuit is
+# ever transpiled.  Set GROVER_CACHE_DIR to keep compiled pieces across runs.
+circuit_cache = CircuitCache(disk_dir=os.environ.get("GROVER_CACHE_DIR"))
+
+# The mcx and range oracles keep a phase-kickback ancilla on qubit n; an MCX
+# strategy adds its ancilla wires after that (mcx.py)
+def grover_width(n, oracle="mcx"):
+    kickback = parse_oracle(oracle)[0] in ("mcx", "range")
+    return n + kickback + mcx_ancillas(oracle, n)
+
+# Gate-level engines: "aer", or a noise_engine(...) name for trajectory runs
+# under a noise model (noise.py).  Other engines have no backend.  The method
+# and precision are picked per circuit width to fit the memory budget
+# (execution.py), which raises MemoryError for a job that cannot fit.
+def gate_level(engine):
+    return engine == "aer" or is_noise_engine(engine)
+
+def engine_backend(engine, num_qubits, extra_bytes=0):
+    if engine == "aer":
+        profile = select(num_qubits, extra_bytes=extra_bytes)
+        return simulator(profile.method, profile.precision)
+    if is_noise_engine(engine):
+        profile = select(num_qubits, allow_mps=False, extra_bytes=extra_bytes)
+        return noisy_backend(engine, profile.method, profile.precision)
+    return None
+
+# Largest n up to n_max whose circuit fits the memory budget, so a sweep can
+# be scaled down up front instead of failing part-way through
+def fit_n_max(n_max, engine="aer", oracle="mcx"):
+    if not gate_level(engine):
+        return n_max
+    limit = max_qubits(allow_mps=engine == "aer")
+    return max((n for n in range(1, n_max+1) if grover_width(n, oracle) <= limit), default=0)
+
+# A noise model restricts the backend to noise.NOISE_BASIS, so noisy backends
+# compile to different circuits under the same backend name; so may methods
+def backend_key(backend):
+    key = f"{backend.name}/{backend.options.method}"
+    return key if backend.options.noise_model is None else f"{key}/noisy"
+
+def compiled_parts(n, marked, oracle="mcx", backend=None):
+    from qiskit import QuantumCircuit, transpile
+    from .circuits import oracle_gate, diffuser_gate
+    backend = backend or engine_backend("aer", grover_width(n, oracle))
+    def compile_gate(build, part):
+        with stage("build", part=part, n=n):
+            gate = build()
+        qc = QuantumCircuit(gate.num_qubits)
+        qc.append(gate, range(gate.num_qubits))
+        with stage("transpile", part=part, n=n) as rec:
+            tqc = transpile(qc, backend)
+            if rec is not None:
+                rec.update(circuit_info(tqc))
+        return tqc
+    key, mcx = backend_key(backend), (parse_oracle(oracle)[1], mcx_ancillas(oracle, n))
+    O = circuit_cache.get(("oracle", oracle, key, n, tuple(sorted(marked))),
+                          lambda: compile_gate(lambda: oracle_gate(oracle, marked, n), oracle))
+    D = circuit_cache.get(("diffuser", key, n, mcx),
+                          lambda: compile_gate(lambda: diffuser_gate(oracle, n), "diffuser"))
+    return O, D
+
+# snapshots=True saves the marked-register probabilities after every O·D pair
+# (labels k0 … kK) instead of measuring at the end; a range of k saves only those
+def compiled_grover_circuit(n, marked, k, snapshots=False, oracle="mcx", backend=None):
+    from qiskit import QuantumCircuit
+    from .circuits import diffuser_wires
+    O, D = compiled_parts(n, marked, oracle, backend)
+    with stage("assemble", n=n, k=k):
+        qc = QuantumCircuit(O.num_qubits, n)
+        wires = diffuser_wires(oracle, n, O.num_qubits)
+        if O.num_qubits - mcx_ancillas(oracle, n) > n:
+            qc.x(n)
+        qc.h(range(n))
+        saved = range(k+1) if snapshots is True else (snapshots or ())
+        if 0 in saved:
+            qc.save_probabilities(range(n), label="k0")
+        for i in range(1, k+1):
+            qc.compose(O, range(O.num_qubits), inplace=True)
+            qc.compose(D, wires, inplace=True)
+            if i in saved:
+                qc.save_probabilities(range(n), label=f"k{i}")
+        if not snapshots:
+            qc.measure(range(n), range(n))
+    return qc
+
+# backend.run as a profiled stage: circuit sizes plus Aer's own metadata
+def run_backend(backend, circuits, **options):
+    with stage("run", shots=options.get("shots")) as rec:
+        result = backend.run(circuits, **options).result()
+        if rec is not None:
+            rec.update(circuit_info(circuits), **aer_info(result))
+    return result
+
+def aer_counts(n, marked, k, shots, oracle="mcx", seed=None, backend=None):
+    backend = backend or engine_backend("aer", grover_width(n, oracle))
+    tqc = compiled_grover_circuit(n, marked, k, oracle=oracle, backend=backend)
+    result = run_backend(backend, tqc, shots=shots, seed_simulator=seed)
+    with stage("decode"):
+        return counts_arrays(result.data(0)["counts"])
+
+ENGINES = {"aer": aer_counts, "numpy": numpy_counts, "analytic": analytic_counts}
+EXACT = {"numpy": numpy_prob, "analytic": analytic_prob}
+
+# Seeded runs are reproducible, so they are served from result_store when one
+# is configured: assigned by the caller (the CLI's --store), or opened from
+# GROVER_STORE on first use.
+result_store = None
+
+def _result_store():
+    global result_store
+    if result_store is None and os.environ.get("GROVER_STORE"):
+        result_store = ResultStore(os.environ["GROVER_STORE"])
+    return result_store
+
+def point_spec(n, marked, k, shots, engine, oracle, seed):
+    spec = {"kind": "counts", "n": n, "marked": sorted(int(x) for x in marked), "k": k,
+            "shots": shots, "seed": seed, "engine": engine}
+    b = engine_backend(engine, grover_width(n, oracle))
+    if b is not None:
+        spec.update(oracle=oracle, backend=b.name,
+                    method=b.options.method, precision=b.options.precision)
+    return spec
+
+# The oracle choice only matters to the gate-level (aer and noisy) engines
+def run_grover_int_counts(n, marked, k, shots=4096, engine="aer", oracle="mcx", seed=None):
+    store = _result_store() if seed is not None else None
+    if store is not None:
+        spec = point_spec(n, marked, k, shots, engine, oracle, seed)
+        hit = store.get(spec)
+        if hit is not None:
+            return hit["outcomes"].astype(np.int64), hit["counts"]
+    b = engine_backend(engine, grover_width(n, oracle))
+    if b is not None:
+        outcomes, counts = aer_counts(n, marked, k, shots, oracle, seed, b)
+    else:
+        outcomes, counts = ENGINES[engine](n, marked, k, shots, seed)
+    if store is not None:
+        store.put(spec, outcomes=outcomes, counts=counts)
+    return outcomes, counts
+
+# Aer-style {bitstring: count}, for display
+def run_grover_counts(n, marked, k, shots=4096, engine="aer", oracle="mcx", seed=None):
+    return to_bitstrings(*run_grover_int_counts(n, marked, k, shots, engine, oracle, seed), n)
+
+# shots=None asks for the exact marked probability (numpy / analytic only)
+@as_point
+def run_grover_prob(n, marked, k, shots=4096, engine="aer", oracle="mcx", seed=None):
+    if shots is None:
+        if engine not in EXACT:
+            raise ValueError(f"engine {engine!r} needs a finite number of shots")
+        return EXACT[engine](n, marked, k)
+    outcomes, counts = run_grover_int_counts(n, marked, k, shots, engine, oracle, seed)
+    with stage("decode"):
+        return marked_hits(outcomes, counts, n, marked)/shots
+
+# Estimate with its Wilson interval, (p, (lo, hi)); on a noisy engine every
+# shot is an independent trajectory, so the interval covers the noise as well
+def run_grover_prob_ci(n, marked, k, shots=4096, engine="aer", oracle="mcx", seed=None,
+                       confidence=0.95):
+    p = run_grover_prob(n, marked, k, shots, engine, oracle, seed)
+    return p, wilson_interval(round(p*shots), shots, confidence)
+
+# Adaptive mode: shots go out in growing batches until a confidence bound puts
+# the probability clearly above or below threshold.  Returns
+# (estimate, (lo, hi), shots spent) instead of a bare probability.
+def run_grover_prob_adaptive(n, marked, k, threshold=0.95, confidence=0.99, batch=64,
+                             max_shots=4096, engine="aer", oracle="mcx", seed=None):
+    rng = make_rng(seed)
+    def draw(shots):
+        outcomes, counts = run_grover_int_counts(n, marked, k, shots, engine, oracle,
+                                                 int(rng.integers(2**32)))
+        return marked_hits(outcomes, counts, n, marked)
+    return sequential_threshold_test(draw, threshold, confidence, batch, max_shots)
+
+# 2b ▸ Iteration sweep — one run of k_max iterations instead of k_max+1 runs.
+#      Shot noise is a binomial draw per k, as if each k had been measured.
+#      Under noise each of `trajectories` shots runs all k_max iterations once
+#      and the snapshots are averaged over them, so every k is a mean over
+#      independent trajectories and no binomial draw is added on top.
+#      Aer keeps every snapshot until its job ends, so the k range is split
+#      into runs that fit the memory budget (sweep_jobs); a run from k_a to
+#      k_b still applies all k_b iterations but saves only its own.
+def aer_sweeps(specs, oracle="mcx", engine="aer", trajectories=1, seed=None):
+    readout = parse_noise_engine(engine).get("readout", 0.0) if is_noise_engine(engine) else 0.0
+    sweeps = [np.empty(spec[2]+1) for spec in specs]
+    for b, idx in by_backend([spec[0] for spec in specs], engine, oracle, snapshots=True):
+        for job in sweep_jobs(specs, idx, oracle, b):
+            circuits = [compiled_grover_circuit(*specs[i][:2], ks[-1], snapshots=ks,
+                                                oracle=oracle, backend=b) for i, ks in job]
+            result = run_backend(b, circuits, shots=trajectories, max_parallel_experiments=0,
+                                 seed_simulator=seed)
+            with stage("decode"):
+                for j, (i, ks) in enumerate(job):
+                    (n, marked, _), data = specs[i], result.data(j)
+                    mask = marked_mask(n, marked)
+                    sweeps[i][ks] = [with_readout(data[f"k{k}"], n, readout)[mask].sum()
+                                     for k in ks]
+    return sweeps
+
+# (spec index, range of k) runs packed into jobs whose snapshots fit the
+# memory budget beside the group's widest state (execution.snapshot_chunks)
+def sweep_jobs(specs, idx, oracle, backend):
+    budget = default_budget()
+    state = max(job_bytes(grover_width(specs[i][0], oracle), backend.options.method,
+                          backend.options.precision) for i in idx)
+    jobs, used = [[]], 0
+    for i in idx:
+        n, _, k_max = specs[i]
+        for ks in snapshot_chunks(n, k_max, state, budget):
+            size = snapshot_bytes(n, len(ks))
+            if jobs[-1] and state + used + size > budget:
+                jobs.append([])
+                used = 0
+            jobs[-1].append((i, ks))
+            used += size
+    return jobs
+
+# Spec indices grouped by the backend their width gets, one job per group;
+# with snapshots the width must also leave room for one of them
+def by_backend(ns, engine, oracle, snapshots=False):
+    groups = {}
+    for i, n in enumerate(ns):
+        extra = snapshot_bytes(n) if snapshots else 0
+        groups.setdefault(engine_backend(engine, grover_width(n, oracle), extra), []).append(i)
+    return groups.items()
+
+# Snapshots are taken before measurement, so readout error is applied to them
+# here: a symmetric flip with probability `flip` on each of the n bits
+def with_readout(probs, n, flip):
+    if not flip:
+        return probs
+    probs = np.asarray(probs).reshape((2,)*n)
+    confusion = np.array([[1-flip, flip], [flip, 1-flip]])
+    for axis in range(n):
+        probs = np.moveaxis(np.tensordot(confusion, probs, axes=(1, axis)), 0, axis)
+    return probs.reshape(-1)
+
+SWEEPS = {"numpy": numpy_sweep, "analytic": analytic_sweep}
+
+# specs are (n, marked, k_max); on Aer all sweeps that share a method and
+# precision go out together, in as few jobs as the memory budget allows
+@as_point
+def sweep_grover_batch(specs, shots=4096, engine="aer", oracle="mcx", seed=None):
+    specs = list(specs)
+    if is_noise_engine(engine):
+        if shots is None:
+            raise ValueError(f"engine {engine!r} needs a finite number of trajectories")
+        return [np.clip(p, 0, 1) for p in aer_sweeps(specs, oracle, engine, shots, seed)]
+    sweeps = aer_sweeps(specs, oracle) if engine == "aer" \
+        else [SWEEPS[engine](n, marked, k_max) for n, marked, k_max in specs]
+    probs = [np.clip(p, 0, 1) for p in sweeps]
+    if shots is None:
+        return probs
+    rng = make_rng(seed)
+    return [rng.binomial(shots, p)/shots for p in probs]
+
+def sweep_grover_probs(n, marked, k_max, shots=4096, engine="aer", oracle="mcx", seed=None):
+    return sweep_grover_batch([(n, marked, k_max)], shots, engine, oracle, seed)[0]
+
+# 2c ▸ Batched submission — specs are (n, marked, k, shots).  Aer gets one
+#      backend.run([...]) per backend and distinct shot count with parallel
+#      experiments on; circuits come pre-compiled from the cache, results keep
+#      spec order.
+@as_point
+def run_grover_batch(specs, engine="aer", oracle="mcx", seed=None):
+    specs = list(specs)
+    if not gate_level(engine):
+        rng = make_rng(seed)
+        return [run_grover_prob(n, marked, k, shots, engine, seed=int(rng.integers(2**32)))
+                for n, marked, k, shots in specs]
+    probs = [None]*len(specs)
+    for b, group in by_backend([spec[0] for spec in specs], engine, oracle):
+        for shots in sorted({specs[i][3] for i in group}):
+            idx = [i for i in group if specs[i][3] == shots]
+            circuits = [compiled_grover_circuit(*specs[i][:3], oracle=oracle, backend=b)
+                        for i in idx]
+            result = run_backend(b, circuits, shots=shots, max_parallel_experiments=0,
+                                 seed_simulator=seed)
+            with stage("decode"):
+                for j, i in enumerate(idx):
+                    outcomes, counts = counts_arrays(result.data(j)["counts"])
+                    probs[i] = marked_hits(outcomes, counts, specs[i][0], specs[i][1])/shots
+    return probs
+
+# Cross-check sampled engines against sin²((2k+1)θ); fails beyond z_max σ
+def check_against_analytic(n, marked, ks, shots=4096, engines=("aer", "numpy"), z_max=5.0):
+    rows, bad = [], []
+    for engine in engines:
+        for k in ks:
+            est, exact = run_grover_prob(n, marked, k, shots, engine), analytic_prob(n, marked, k)
+            sigma = max(sqrt(exact*(1-exact)/shots), 1/shots)
+            rows.append((engine, k, est, exact, abs(est-exact)/sigma))
+            if rows[-1][-1] > z_max:
+                bad.append(rows[-1])
+    if bad:
+        raise AssertionError(f"engines disagree with the analytic value: {bad}")
+    return rows
+
+# 3 ▸ Unknown-M search
+#   method="scan" — k = 1, 2, … against a probability threshold; the k bound
+#                   uses len(marked), so M is not really unknown
+#   method="bbht" — Boyer–Brassard–Høyer–Tapp; both return (k, oracle calls)
+# adaptive=True lets each scan step stop early once a sequential test has
+# decided which side of threshold it is on, with shots as the upper budget.
+def search_grover_unknown_M(n, marked, threshold=0.95, shots=4096, engine="aer", oracle="mcx",
+                            seed=None, method="scan", adaptive=False):
+    if method == "bbht":
+        x, k, calls = search_grover_bbht(n, marked, engine, oracle, seed)
+        return k, calls
+    M, N = len(marked), 2**n
+    k_bound = math.ceil((math.pi/4)*math.sqrt(N/M))*2 + 5
+    rng = make_rng(seed)
+    # A noisy engine has no exact sweep to draw binomials from, so its
+    # adaptive batches are fresh trajectories run at that k
+    trajectories = adaptive and is_noise_engine(engine)
+    probs = [None]*(k_bound+1) if trajectories else \
+        sweep_grover_probs(n, marked, k_bound, None if adaptive else shots, engine, oracle,
+                           int(rng.integers(2**32)))
+    calls = 0                              # as separate runs of 1 … k iterations
+    for k in range(1, k_bound+1):
+        spent = shots
+        if trajectories:
+            def draw(s):
+                outcomes, counts = run_grover_int_counts(n, marked, k, s, engine, oracle,
+                                                         int(rng.integers(2**32)))
+                return marked_hits(outcomes, counts, n, marked)
+            probs[k], _, spent = sequential_threshold_test(draw, threshold, max_shots=shots)
+        elif adaptive:
+            draw = lambda s: rng.binomial(s, probs[k])
+            probs[k], _, spent = sequential_threshold_test(draw, threshold, max_shots=shots)
+        calls += spent*k
+        if probs[k] >= threshold:
+            return k, calls
+    return None, None
+
+# BBHT with M genuinely unknown: `marked` only builds the oracle and the
+# classical check f(x).  Each round draws j uniformly from [0, m), runs j
+# iterations, measures once and checks the outcome; m grows by lam up to √N.
+# Expected cost is O(√(N/M)) oracle calls.  Returns (x, j, calls), where
+# calls counts Grover iterations plus one classical check per round, or
+# (None, None, calls) once max_calls is spent (e.g. when M = 0).
+def search_grover_bbht(n, marked, engine="aer", oracle="mcx", seed=None, lam=6/5, max_calls=None):
+    is_marked = set(marked).__contains__
+    max_calls = max_calls or bbht_max_calls(n)
+    calls = 0
+    for j, x in bbht_rounds(n, marked, engine, oracle, seed, lam):
+        calls += j + 1
+        if is_marked(x):
+            return x, j, calls
+        if calls >= max_calls:
+            return None, None, calls
+
+def bbht_max_calls(n):
+    return 10*math.ceil(sqrt(2**n)) + 10
+
+# The rounds of a BBHT search, endlessly: (j, measured x) per round, for
+# callers that check x or count the cost their own way
+def bbht_rounds(n, marked, engine="aer", oracle="mcx", seed=None, lam=6/5):
+    rng, m = make_rng(seed), 1.0
+    while True:
+        j = int(rng.integers(0, math.ceil(m)))
+        outcomes, _ = run_grover_int_counts(n, marked, j, 1, engine, oracle, int(rng.integers(2**32)))
+        yield j, int(outcomes[0])
+        m = min(lam*m, sqrt(2**n))
+
+# 3b ▸ Grid-point tasks for runner.run_tasks — one per curve / per n, each
+#      drawing everything random from its own seed
+def oscillation_curve(n, M, k_max=16, shots=4096, engine="aer", oracle="mcx", seed=None):
+    rng = make_rng(seed)
+    marked = rng.choice(2**n, M, replace=False).tolist()
+    return sweep_grover_probs(n, marked, k_max, shots, engine, oracle,
+                              int(rng.integers(2**32))).tolist()
+
+def scaling_point(n, M, shots=16384, engine="aer", oracle="mcx", seed=None):
+    k0 = math.ceil((math.pi/4)*math.sqrt(2**n/M))
+    probs = sweep_grover_probs(n, list(range(M)), k0+1, shots, engine, oracle, seed)
+    return max([max(1, k0-1), k0, k0+1], key=lambda k: probs[k])
+
+def unknown_M_point(n, M, shots=4096, engine="aer", oracle="mcx", method="scan", adaptive=False,
+                    seed=None):
+    rng, marked = make_rng(seed), list(range(M))
+    k, calls = search_grover_unknown_M(n, marked, shots=shots, engine=engine, oracle=oracle,
+                                       seed=int(rng.integers(2**32)), method=method,
+                                       adaptive=adaptive)
+    seed = int(rng.integers(2**32))
+    prob = run_grover_prob(n, marked, k, shots, engine, oracle, seed) if k is not None else None
+    return [k, calls, prob]
+
+# BBHT's j is random, so a point is `trials` searches: their oracle calls and
+# how many of them found a marked state
+def bbht_point(n, M, trials=100, engine="aer", oracle="mcx", seed=None):
+    rng, marked = make_rng(seed), list(range(M))
+    runs = [search_grover_bbht(n, marked, engine, oracle, int(rng.integers(2**32)))
+            for _ in range(trials)]
+    return [[calls for _, _, calls in runs], sum(x is not None for x, _, _ in runs)]
@@ -0,0 +1,47 @@
+# grover/stats.py  –  binomial confidence intervals and a sequential threshold test
+#
+# sequential_threshold_test spends shots in geometrically growing batches
+# (batch, batch, 2·batch, 4·batch, …) and stops as soon as a Wilson interval
+# lies entirely on one side of the threshold.  The error budget 1-confidence
+# is split evenly over the at most ⌈log2(max_shots/batch)⌉+1 looks of that
+# schedule, the last one possibly partial (Bonferroni), so the decision holds
+# at the stated confidence despite peeking.  The interval returned is the
+# last look's, at that per-look confidence.
+
+import math
+from statistics import NormalDist
+
+def wilson_interval(hits, shots, confidence=0.95):
+    if shots == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(1 - (1-confidence)/2)
+    p = hits/shots
+    centre = (p + z*z/(2*shots)) / (1 + z*z/shots)
+    half = z*math.sqrt(p*(1-p)/shots + z*z/(4*shots*shots)) / (1 + z*z/shots)
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+# draw(shots) -> number of successes.  Returns (estimate, (lo, hi), shots spent);
+# if max_shots runs out first the caller falls back to the point estimate.
+# Looks of the doubling schedule: one at batch shots, then one per doubling,
+# the last capped at max_shots
+def sequential_looks(batch, max_shots):
+    looks, shots = 1, min(batch, max_shots)
+    while shots < max_shots:
+        shots = min(2*shots, max_shots)
+        looks += 1
+    return looks
+
+def sequential_threshold_test(draw, threshold, confidence=0.99, batch=64, max_shots=4096):
+    looks = sequential_looks(batch, max_shots)
+    per_look = 1 - (1-confidence)/looks
+    hits = shots = 0
+    step = batch
+    while shots < max_shots:
+        step = min(step, max_shots - shots)
+        hits += draw(step)
+        shots += step
+        lo, hi = wilson_interval(hits, shots, per_look)
+        if lo >= threshold or hi < threshold:
+            break
+        step = shots                       # double the total each look
+    return hits/shots, (lo, hi), shots
@@ -0,0 +1,133 @@
+# resources.py  –  static resource estimates, and a regression check on them
+#
+#   estimate(build_oracle(marked, n), data_qubits=n)      # any circuit or gate
+#   grover_resources(n=8, M=4, k=None, oracle="esop")      # k=None: the optimal k
+#   python resources.py                    # table for the regression grid
+#   python resources.py --check            # exit 1 if any cost went up
+#   python resources.py --update           # accept the current costs
+#
+# Nothing is simulated: circuits are decomposed to a basis (default CX + U) and
+# counted — qubits, ancillas, total and 2-qubit gates, depth and the memory a
+# statevector of that width needs — plus a T-count from a separate Clifford+T
+# decomposition, where rz angles that are odd multiples of π/4 count as one T
+# and any other angle as a rotation still to be synthesised.  The ALU circuits
+# in src/alu.py go through estimate() the same way.
+#
+# A Grover circuit is prep + k·(O + D), so grover_resources estimates O and D
+# once and scales; its depth is the sum of the parts, an upper bound.  An
+# oracle name may carry an MCX strategy ("mcx:relative-phase=2",
+# grover/mcx.py); its ancilla wires count as ancillas.
+
+import json
+import math
+import argparse
+from pathlib import Path
+from qiskit import QuantumCircuit, transpile
+from grover.circuits import diffuser, oracle_gate, diffuser_gate
+from grover.mcx import MCX_STRATEGIES, mcx_oracle, parse_oracle, mcx_ancillas
+
+BASIS = ("cx", "u")
+CLIFFORD_T = ("cx", "h", "s", "sdg", "t", "tdg", "x", "y", "z", "rz")
+BASELINE = Path(__file__).with_name("resources_baseline.json")
+METRICS = ("qubits", "ancillas", "gates", "two_qubit", "t_count", "rotations", "depth")
+
+def _as_circuit(op):
+    if isinstance(op, QuantumCircuit):
+        return op.remove_final_measurements(inplace=False)
+    qc = QuantumCircuit(op.num_qubits)
+    qc.append(op, range(op.num_qubits))
+    return qc
+
+def _t_count(qc):
+    t = transpile(qc, basis_gates=list(CLIFFORD_T), seed_transpiler=0)
+    ops = t.count_ops()
+    t_count, rotations = ops.get("t", 0) + ops.get("tdg", 0), 0
+    for inst in t.data:
+        if inst.operation.name == "rz":
+            eighths = float(inst.operation.params[0]) / (math.pi/4)
+            if abs(eighths - round(eighths)) > 1e-9:
+                rotations += 1
+            elif round(eighths) % 2:
+                t_count += 1
+    return t_count, rotations
+
+# data_qubits: the width of the problem register, so the rest counts as ancillas
+def estimate(op, basis=BASIS, data_qubits=None, precision="double"):
+    qc = _as_circuit(op)
+    t = transpile(qc, basis_gates=list(basis), seed_transpiler=0)
+    ops = t.count_ops()
+    t_count, rotations = _t_count(qc)
+    return {"qubits": t.num_qubits,
+            "ancillas": t.num_qubits - data_qubits if data_qubits is not None else None,
+            "gates": sum(ops.values()),
+            "two_qubit": sum(1 for inst in t.data if inst.operation.num_qubits == 2),
+            "t_count": t_count, "rotations": rotations, "depth": t.depth(),
+            "statevector_bytes": 2**t.num_qubits * (16 if precision == "double" else 8)}
+
+def _evenly_spaced(n, M):
+    return [i * (2**n // M) for i in range(M)]
+
+# marked defaults to M evenly spaced states (M contiguous ones for "range")
+def grover_resources(n, M, k=None, oracle="mcx", marked=None, basis=BASIS):
+    if marked is None:
+        marked = list(range(M)) if parse_oracle(oracle)[0] == "range" else _evenly_spaced(n, M)
+    k = math.floor((math.pi/4)*math.sqrt(2**n/M)) if k is None else k
+    O = estimate(oracle_gate(oracle, marked, n), basis, data_qubits=n)
+    D = estimate(diffuser_gate(oracle, n), basis, data_qubits=n)
+    prep = QuantumCircuit(O["qubits"])
+    if O["qubits"] - mcx_ancillas(oracle, n) > n:
+        prep.x(n)
+    prep.h(range(n))
+    P = estimate(prep, basis)
+    total = {m: P[m] + k*(O[m] + D[m]) for m in ("gates", "two_qubit", "t_count",
+                                                  "rotations", "depth")}
+    total.update(qubits=O["qubits"], ancillas=O["ancillas"], k=k,
+                 statevector_bytes=O["statevector_bytes"])
+    return {"oracle": O, "diffuser": D, "total": total}
+
+# The regression grid: each oracle builder's total cost at the optimal k, then
+# the mcx oracle under each MCX strategy with a full ladder and with two ancillas
+GRID = [(oracle, n, M) for oracle in ("mcx", "phase", "esop", "range")
+        for n in (4, 6, 8) for M in (1, 4)]
+GRID += [("mcx", 12, 1)] + [(mcx_oracle("mcx", strategy, ancillas), n, 1) for strategy in MCX_STRATEGIES[1:]
+         for ancillas in (None, 2) for n in (8, 12)]
+
+def grid_costs():
+    costs = {}
+    for oracle, n, M in GRID:
+        total = grover_resources(n, M, oracle=oracle)["total"]
+        costs[f"{oracle}/n={n}/M={M}"] = {m: total[m] for m in METRICS}
+    for n in (4, 6, 8):
+        D = estimate(diffuser(n), data_qubits=n)
+        costs[f"diffuser/n={n}"] = {m: D[m] for m in METRICS}
+    return costs
+
+# Returns the (name, metric, baseline, now) rows that got worse
+def regressions(costs, baseline):
+    worse = []
+    for name, now in costs.items():
+        for m, value in now.items():
+            before = baseline.get(name, {}).get(m)
+            if before is not None and value is not None and value > before:
+                worse.append((name, m, before, value))
+    return worse
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Static resource estimates for the Grover circuits")
+    ap.add_argument("--check", action="store_true", help="fail if a cost exceeds the baseline")
+    ap.add_argument("--update", action="store_true", help="write the current costs as the baseline")
+    ap.add_argument("--baseline", type=Path, default=BASELINE)
+    args = ap.parse_args()
+
+    costs = grid_costs()
+    print(f"{'circuit':<30}" + "".join(f"{m:>11}" for m in METRICS))
+    for name, c in costs.items():
+        print(f"{name:<30}" + "".join(f"{str(c[m]):>11}" for m in METRICS))
+    if args.update:
+        args.baseline.write_text(json.dumps(costs, indent=1, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+    elif args.check:
+        worse = regressions(costs, json.loads(args.baseline.read_text()))
+        for name, m, before, value in worse:
+            print(f"REGRESSION {name} {m}: {before} -> {value}")
+        raise SystemExit(1 if worse else 0)
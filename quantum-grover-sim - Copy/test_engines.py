@@ -0,0 +1,11 @@
+from grover.engines import analytic_counts, analytic_prob
+
+def test_analytic_counts_with_every_state_marked():
+    for k in range(8):
+        outcomes, counts = analytic_counts(3, range(8), k, 4096, seed=k)
+        assert counts.sum() == 4096 and set(outcomes) <= set(range(8))
+
+def test_analytic_duplicate_marked_indices():
+    assert analytic_prob(6, [5, 5, 5], 3) == analytic_prob(6, [5], 3)
+    outcomes, counts = analytic_counts(6, [5, 5], 6, 1000, seed=1)
+    assert list(outcomes).count(5) == 1 and counts.sum() == 1000
@@ -0,0 +1,15 @@
+from grover.simulate import search_grover_unknown_M
+from grover.noise import noise_engine
+
+def test_adaptive_scan_on_noisy_engine():
+    engine = noise_engine(depol2=1e-3)
+    k, calls = search_grover_unknown_M(4, [3], threshold=0.8, shots=256, engine=engine,
+                                       seed=1, adaptive=True)
+    assert k == 2                          # sin²(5θ) ≈ 0.91 for N = 16, M = 1
+    assert 0 < calls <= 256 * (1 + 2)
+
+def test_adaptive_scan_agrees_with_fixed_shots():
+    fixed, _ = search_grover_unknown_M(6, [5], shots=1024, engine="numpy", seed=2)
+    adaptive, _ = search_grover_unknown_M(6, [5], shots=1024, engine="numpy", seed=2,
+                                          adaptive=True)
+    assert fixed == adaptive == 5           # sin²(11θ) ≈ 0.96 for N = 64
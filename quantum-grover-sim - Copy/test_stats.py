@@ -0,0 +1,9 @@
+from grover.stats import sequential_looks, sequential_threshold_test
+
+def test_looks_match_the_doubling_schedule():
+    for max_shots in (10, 64, 65, 1000, 4096):
+        draws = []
+        sequential_threshold_test(lambda s: draws.append(s) or s//2, 0.5, max_shots=max_shots)
+        assert len(draws) == sequential_looks(64, max_shots)
+        assert sum(draws) == max_shots
+    assert sequential_looks(64, 1000) == 5                 # 64, 128, 256, 512, 1000
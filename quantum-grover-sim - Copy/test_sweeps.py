@@ -0,0 +1,18 @@
+import numpy as np
+from grover import simulate
+
+def test_sweep_split_to_fit_memory_budget(monkeypatch):
+    specs = [(8, [5], 20), (6, [1], 9)]
+    whole = simulate.aer_sweeps(specs)
+    monkeypatch.setenv("GROVER_MEMORY_MB", "0.02")     # 8 KiB state + 6 snapshots of 2 KiB
+    backend = simulate.engine_backend("aer", 9, 2048)
+    assert backend.options.max_memory_mb == 1            # not the cached default budget
+    assert len(simulate.sweep_jobs(specs, [0, 1], "mcx", backend)) == 4
+    for full, split in zip(whole, simulate.aer_sweeps(specs)):
+        assert np.allclose(full, split)
+
+def test_backend_follows_budget_changes(monkeypatch):
+    for mb in (64, 128):
+        monkeypatch.setenv("GROVER_MEMORY_MB", str(mb))
+        assert simulate.engine_backend("aer", 6).options.max_memory_mb == mb
+        assert simulate.engine_backend("noisy:depol2=0.01", 6).options.max_memory_mb == mb
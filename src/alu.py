@@ -0,0 +1,159 @@
+# alu.py  –  AND / XOR / ADD builders and an exhaustive truth-table verifier
+#
+#   from alu import and_circuit, ElementaryGatesAND, verify_truth_table, TRUTH_TABLES
+#   verify_truth_table(*and_circuit(4, ElementaryGatesAND), TRUTH_TABLES["and"])
+#
+# Every *_circuit(N) returns (circuit, output qubits) with the inputs in
+# registers "a" and "b".  verify_truth_table checks all 4^N input pairs in one
+# sampler submission, either
+#   method="pubs"       — one X-prepared circuit per pair, all as PUBs of a
+#                         single StatevectorSampler().run call, or
+#   method="entangled"  — one circuit: a and b in uniform superposition, copied
+#                         into reference registers by CX before the operation,
+#                         so every shot is an (a, b, output) row of the table.
+# Both replace a circuit with initialize() and a separate sampler call per pair.
+# method="permutation" skips the sampler for the bit-sliced basis-state
+# simulator in permutation_sim.py: every pair up to N = 11, and beyond that
+# (32- and 64-bit operands) a random sample of `shots` pairs.
+
+import math
+import time
+from itertools import product
+import numpy as np
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit.library import AndGate, FullAdderGate
+from qiskit.primitives import StatevectorSampler
+from permutation_sim import simulate_basis
+
+EXHAUSTIVE_MAX_BITS = 11               # 4^11 = 4M pairs for method="permutation"
+
+and_gate = AndGate(2) # AND gate takes 2 qubits as input
+
+def QiskitAND(qc, a, b, target):
+    qc.append(and_gate, [a, b, target])
+
+def ToffoliGateAND(qc, a, b, target):
+    qc.ccx(a, b, target)
+
+# A Toffoli up to a relative phase: correct on basis states, 3 CX instead of 6
+def ElementaryGatesAND(qc, a, b, target):
+    qc.h(target)
+    qc.tdg(target)
+    qc.cx(a, target)
+    qc.t(target)
+    qc.cx(b, target)
+    qc.tdg(target)
+    qc.cx(a, target)
+    qc.t(target)
+    qc.h(target)
+
+# Result goes to reg_b
+def bitwiseXOR(qc, reg_a, reg_b):
+    assert(reg_a.size == reg_b.size)
+    for i in range(reg_a.size):
+        qc.cx(reg_a[i], reg_b[i])
+
+# cin + a + b, with the sum in b and the carry in cout
+def FullAdder(qc, cin, reg_a, reg_b, cout):
+    qc.append(FullAdderGate(reg_a.size), [cin, *reg_a, *reg_b, cout])
+
+def and_circuit(N, ANDFunc=ToffoliGateAND):
+    a, b, target = QuantumRegister(N, "a"), QuantumRegister(N, "b"), QuantumRegister(N, "t")
+    qc = QuantumCircuit(a, b, target)
+    for i in range(N):
+        ANDFunc(qc, a[i], b[i], target[i])
+    return qc, list(target)
+
+def xor_circuit(N):
+    a, b = QuantumRegister(N, "a"), QuantumRegister(N, "b")
+    qc = QuantumCircuit(a, b)
+    bitwiseXOR(qc, a, b)
+    return qc, list(b)
+
+def adder_circuit(N):
+    cin, a = QuantumRegister(1, "cin"), QuantumRegister(N, "a")
+    b, cout = QuantumRegister(N, "b"), QuantumRegister(1, "cout")
+    qc = QuantumCircuit(cin, a, b, cout)
+    FullAdder(qc, cin[0], a, b, cout[0])
+    return qc, [*b, *cout]              # N+1 bit sum
+
+# Expected outputs, for verify_truth_table
+TRUTH_TABLES = {
+    "and": lambda a, b: a & b,
+    "xor": lambda a, b: a ^ b,
+    "add": lambda a, b: a + b,
+}
+
+def _reg(qc, name):
+    return next(r for r in qc.qregs if r.name == name)
+
+def _pub_circuits(op, out, N):
+    a, b = _reg(op, "a"), _reg(op, "b")
+    circuits = []
+    for a_val, b_val in product(range(2**N), range(2**N)):
+        res = ClassicalRegister(len(out), "res")
+        qc = QuantumCircuit(*op.qregs, res)
+        for i in range(N):             # X gates instead of initialize()
+            if (a_val >> i) & 1: qc.x(a[i])
+            if (b_val >> i) & 1: qc.x(b[i])
+        qc.compose(op, inplace=True)
+        qc.measure(out, res)
+        circuits.append(qc)
+    return circuits
+
+def _entangled_circuit(op, out, N):
+    a, b = _reg(op, "a"), _reg(op, "b")
+    ref_a, ref_b = QuantumRegister(N, "ref_a"), QuantumRegister(N, "ref_b")
+    res = ClassicalRegister(2*N + len(out), "res")   # ref_a | ref_b | output
+    qc = QuantumCircuit(*op.qregs, ref_a, ref_b, res)
+    qc.h(a); qc.h(b)
+    qc.cx(a, ref_a); qc.cx(b, ref_b)
+    qc.compose(op, inplace=True)
+    qc.measure([*ref_a, *ref_b, *out], res)
+    return qc
+
+# Every (a, b) pair, or `samples` random ones; object arrays past 62 bits so
+# that expected(a, b) cannot overflow
+def _input_pairs(N, samples, rng):
+    if N <= EXHAUSTIVE_MAX_BITS:
+        a_vals, b_vals = np.divmod(np.arange(4**N), 2**N)
+        return a_vals, b_vals
+    if N <= 62:
+        return rng.integers(0, 2**N, (2, samples))
+    words = rng.integers(0, 2**32, (2, samples, -(-N // 32))).astype(object)
+    vals = sum(words[..., j] << 32*j for j in range(words.shape[-1]))
+    return vals % 2**N
+
+# Returns {"pairs", "checked", "failures": [(a, b, outputs seen)], "seconds"}.
+# With method="entangled" the default shots make a missed pair unlikely
+# (coupon collector over 4^N pairs); "checked" is how many were actually seen.
+def verify_truth_table(op, out, expected, method="pubs", shots=None, sampler=None, seed=None):
+    N = _reg(op, "a").size
+    sampler = sampler or StatevectorSampler()
+    t0 = time.perf_counter()
+    seen = {}                          # (a, b) -> set of outputs measured
+    if method == "pubs":
+        pairs = product(range(2**N), range(2**N))
+        result = sampler.run(_pub_circuits(op, out, N), shots=shots or 16).result()
+        for pair, pub in zip(pairs, result):
+            seen[pair] = set(pub.data.res.get_int_counts())
+    elif method == "entangled":
+        shots = shots or math.ceil(4**N * (math.log(4**N) + 10))
+        result = sampler.run([_entangled_circuit(op, out, N)], shots=shots).result()
+        mask = 2**N - 1
+        for row in result[0].data.res.get_int_counts():
+            seen.setdefault((row & mask, (row >> N) & mask), set()).add(row >> 2*N)
+    elif method == "permutation":
+        a_vals, b_vals = _input_pairs(N, shots or 2**16, np.random.default_rng(seed))
+        got = simulate_basis(op, {"a": a_vals, "b": b_vals}, {"res": out})["res"]
+        for i in np.flatnonzero(got != expected(a_vals, b_vals)):
+            seen[int(a_vals[i]), int(b_vals[i])] = {int(got[i])}
+        failures = [(a_val, b_val, sorted(got)) for (a_val, b_val), got in sorted(seen.items())]
+        return {"pairs": 4**N, "checked": len(a_vals), "failures": failures,
+                "seconds": time.perf_counter() - t0}
+    else:
+        raise ValueError(f"unknown method {method!r}")
+    failures = [(a_val, b_val, sorted(got)) for (a_val, b_val), got in sorted(seen.items())
+                if got != {expected(a_val, b_val)}]
+    return {"pairs": 4**N, "checked": len(seen), "failures": failures,
+            "seconds": time.perf_counter() - t0}
@@ -0,0 +1,159 @@
+# permutation_sim.py  –  bit-sliced simulator for reversible classical circuits
+#
+#   out = simulate_basis(qc, {"a": a_vals, "b": b_vals})     # NumPy arrays of inputs
+#   out["t"], out["phase"]
+#
+# A circuit of X / CX / CCX / MCX gates (any control state), Z-type phases and
+# basis-state initialize/reset maps basis states to basis states, so there is
+# no need for a 2^n statevector: each qubit is one bit per input, packed 64
+# inputs to a uint64 word, and a gate is a few word-wise ANDs and an XOR,
+# O(gates) per input whatever the width.  That reaches 64-bit adders and
+# millions of inputs per call.
+#
+# Other gates are expanded through their definitions (AndGate, FullAdderGate,
+# IntegerComparatorGate, …).  H is allowed when it conjugates X-type gates on
+# one qubit, h(q) … mcx(c, q) … h(q), which is an MCZ over c and q: that is
+# how build_oracle and the comparator oracles flip phases, and the resulting
+# sign per input comes back as out["phase"] (a global phase of π included).
+# Anything else (T, a relative-phase Toffoli, H left open) raises ValueError.
+
+import math
+import numpy as np
+from qiskit.circuit import ControlledGate
+
+ONES = np.uint64(2**64 - 1)
+IGNORED = {"barrier", "measure", "delay", "id"}
+
+# Ops are ("x", target, controls, ctrl_bits), ("z", None, controls, ctrl_bits)
+# or ("set", qubits, value) with qubits least significant first.
+def basis_ops(qc):
+    ops, phase = [], [0.0]
+    framed = set()                     # qubits between an opening and closing H
+    def walk(circuit, qmap):
+        phase[0] += float(circuit.global_phase)
+        for inst in circuit.data:
+            op, qubits = inst.operation, [qmap[circuit.find_bit(q).index] for q in inst.qubits]
+            name = op.name
+            if name in IGNORED:
+                continue
+            if name == "h":
+                framed.symmetric_difference_update(qubits)   # open, or close, the frame
+            elif name in ("x", "z") or (isinstance(op, ControlledGate)
+                                        and op.base_gate.name in ("x", "z")):
+                n_ctrl = len(qubits) - 1
+                bits = op.ctrl_state if isinstance(op, ControlledGate) else 0
+                controls = tuple(qubits[:-1])
+                if framed.intersection(controls):
+                    raise ValueError(f"{name} is controlled by a qubit inside an H frame")
+                ctrl_bits = tuple((bits >> i) & 1 for i in range(n_ctrl))
+                target = qubits[-1]
+                base = op.base_gate.name if isinstance(op, ControlledGate) else name
+                if base == "x" and target in framed:     # H X H = Z
+                    base = "z"
+                elif base == "z" and target in framed:
+                    raise ValueError(f"{name} on qubit {target} inside an H frame")
+                if base == "z":        # symmetric in its qubits: target acts as a control
+                    ops.append(("z", None, controls + (target,), ctrl_bits + (1,)))
+                else:
+                    ops.append(("x", target, controls, ctrl_bits))
+            elif name in ("initialize", "reset"):
+                if any(q in framed for q in qubits):
+                    raise ValueError(f"{name} inside an H frame")
+                ops.append(("set", tuple(qubits), _basis_index(op, len(qubits))))
+            elif op.definition is not None:
+                walk(op.definition, qubits)
+            else:
+                raise ValueError(f"{name} is not a basis-state permutation")
+    walk(qc, list(range(qc.num_qubits)))
+    if framed:
+        raise ValueError(f"H on qubits {sorted(framed)} is never undone")
+    turns = phase[0] / math.pi
+    if abs(turns - round(turns)) > 1e-9:
+        raise ValueError(f"global phase {phase[0]} is not a sign")
+    if round(turns) % 2:
+        ops.append(("z", None, (), ()))
+    return ops
+
+def _basis_index(op, width):
+    if op.name == "reset" or not op.params:
+        return 0
+    params = op.params
+    if isinstance(params[0], str):     # a label, most significant qubit first
+        return int("".join(params), 2)
+    if len(params) == 1:               # an integer
+        return int(np.real(params[0]))
+    amps = np.asarray(params, dtype=complex)
+    index = int(np.argmax(np.abs(amps)))
+    if not np.isclose(abs(amps[index]), 1.0):
+        raise ValueError("initialize to a superposition is not a basis state")
+    return index
+
+def is_permutation_circuit(qc):
+    try:
+        basis_ops(qc)
+    except ValueError:
+        return False
+    return True
+
+# Wide values (Python ints in object arrays) go through 64-bit limbs, so the
+# slow object arithmetic is per limb rather than per bit
+def _limbs(values, width):
+    values = np.asarray(values)
+    if values.dtype != object:
+        return [values.astype(np.uint64)]
+    return [((values >> 64*j) & (2**64 - 1)).astype(np.uint64) for j in range(-(-width // 64))]
+
+def _pack(values, width, words):
+    limbs = _limbs(values, width)
+    bits = np.zeros((width, words*64), dtype=np.uint8)
+    for i in range(width):
+        bits[i, :len(limbs[0])] = (limbs[i // 64] >> np.uint64(i % 64)) & np.uint64(1)
+    return np.packbits(bits, axis=1, bitorder="little").view("<u8")
+
+def _unpack(rows, batch):
+    bits = np.unpackbits(rows.view(np.uint8), axis=1, bitorder="little")[:, :batch]
+    limbs = []
+    for j in range(0, len(bits), 64):
+        chunk = bits[j:j+64].astype(np.uint64)
+        limbs.append((chunk << np.arange(len(chunk), dtype=np.uint64)[:, None]).sum(0, dtype=np.uint64))
+    if len(limbs) == 1:
+        return limbs[0].astype(np.int64) if len(bits) <= 63 else limbs[0]
+    out = np.zeros(batch, dtype=object)
+    for j, limb in enumerate(limbs):
+        out += limb.astype(object) << 64*j
+    return out
+
+# inputs and outputs are keyed by register name; outputs defaults to every
+# register and may also map a name to a list of qubits.  Values wider than 64
+# bits are Python ints in object arrays.  Qubits without an input start in 0.
+def simulate_basis(qc, inputs, outputs=None):
+    ops = basis_ops(qc)
+    regs = {r.name: list(r) for r in qc.qregs}
+    batch = max((np.size(v) for v in inputs.values()), default=1)
+    words = -(-batch // 64)
+    state = np.zeros((qc.num_qubits, words), dtype=np.uint64)
+    for name, values in inputs.items():
+        idx = [qc.find_bit(q).index for q in regs[name]]
+        state[idx] = _pack(np.broadcast_to(values, (batch,)), len(idx), words)
+    sign = np.zeros(words, dtype=np.uint64)
+    for op in ops:
+        if op[0] == "set":
+            _, qubits, value = op
+            for i, q in enumerate(qubits):
+                state[q] = ONES if (value >> i) & 1 else 0
+            continue
+        kind, target, controls, ctrl_bits = op
+        mask = np.full(words, ONES)
+        for c, bit in zip(controls, ctrl_bits):
+            mask &= state[c] if bit else ~state[c]
+        if kind == "x":
+            state[target] ^= mask
+        else:
+            sign ^= mask
+    outputs = outputs or regs
+    out = {}
+    for name, qubits in outputs.items():
+        idx = [q if isinstance(q, int) else qc.find_bit(q).index for q in qubits]
+        out[name] = _unpack(state[idx], batch)
+    out["phase"] = np.unpackbits(sign.view(np.uint8), bitorder="little")[:batch].astype(bool)
+    return out
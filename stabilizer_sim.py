@@ -0,0 +1,189 @@
+# stabilizer_sim.py  –  Clifford fast path and one-pass Pauli expectation values
+#
+#   bits = sample_bits(qc, shots=1000, seed=7)          # (shots, n) uint8, bits[:, q] = qubit q
+#   estimate_paulis(qc, ["ZZII", "ZIZI", "XXXX"], shots=4000)
+#
+# A circuit made only of Clifford gates (H, S, X, CX, CZ, SWAP, …) prepares a
+# stabilizer state, whose computational-basis outcomes are uniform over an
+# affine subspace x0 + span(G).  sample_bits tracks the stabilizer tableau
+# (Aaronson–Gottesman, n rows of 2n bits plus signs) instead of amplitudes,
+# row-reduces it once to get x0 and G, and then every shot is a random
+# combination of G's rows: a 1000-qubit GHZ state samples in milliseconds.
+# Anything non-Clifford goes to AerSimulator's automatic method.
+#
+# estimate_paulis groups the operators into qubit-wise commuting sets, samples
+# each set's measurement basis once and reads every operator in the set off
+# those bitstrings as a vectorised parity, e.g. all n-1 ⟨Z0 Zi⟩ of a GHZ state
+# from one set of shots instead of one estimator evaluation per operator.
+
+import numpy as np
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Pauli, SparsePauliOp
+from qiskit_aer import AerSimulator
+
+# Clifford gates in terms of the tableau primitives h, s and cx
+CLIFFORD_GATES = {
+    "h": [("h", 0)], "s": [("s", 0)], "sdg": [("s", 0)]*3, "z": [("s", 0)]*2,
+    "x": [("h", 0), ("s", 0), ("s", 0), ("h", 0)],
+    "y": [("s", 0), ("s", 0), ("h", 0), ("s", 0), ("s", 0), ("h", 0)],
+    "sx": [("h", 0), ("s", 0), ("h", 0)], "sxdg": [("h", 0)] + [("s", 0)]*3 + [("h", 0)],
+    "cx": [("cx", 0, 1)], "cz": [("h", 1), ("cx", 0, 1), ("h", 1)],
+    "swap": [("cx", 0, 1), ("cx", 1, 0), ("cx", 0, 1)],
+    "id": [],
+}
+IGNORED = {"barrier", "measure"}
+
+def is_clifford(qc):
+    return all(inst.operation.name in CLIFFORD_GATES or inst.operation.name in IGNORED
+               for inst in qc.data)
+
+# Stabilizer rows of |0…0> pushed through the circuit: x, z (rows × qubits) and sign bits r
+def tableau(qc):
+    n = qc.num_qubits
+    x, z, r = np.zeros((n, n), dtype=bool), np.eye(n, dtype=bool), np.zeros(n, dtype=bool)
+    for inst in qc.data:
+        name = inst.operation.name
+        if name in IGNORED:
+            continue
+        qubits = [qc.find_bit(q).index for q in inst.qubits]
+        for prim, *args in CLIFFORD_GATES[name]:
+            a = qubits[args[0]]
+            if prim == "h":
+                r ^= x[:, a] & z[:, a]
+                x[:, a], z[:, a] = z[:, a].copy(), x[:, a].copy()
+            elif prim == "s":
+                r ^= x[:, a] & z[:, a]
+                z[:, a] ^= x[:, a]
+            else:
+                b = qubits[args[1]]
+                r ^= x[:, a] & z[:, b] & ~(x[:, b] ^ z[:, a])
+                x[:, b] ^= x[:, a]
+                z[:, a] ^= z[:, b]
+    return x, z, r
+
+# Rows as Python ints (bit q = qubit q), so a row operation is one XOR
+def _row_ints(bits):
+    packed = np.packbits(bits, axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+def _int_bits(rows, n):
+    nbytes = (n + 7) // 8
+    data = b"".join(row.to_bytes(nbytes, "little") for row in rows)
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder="little")
+    return bits.reshape(len(rows), 8*nbytes)[:, :n].astype(bool)
+
+# Sign of the product (x1, z1, r1)·(x2, z2, r2): Aaronson–Gottesman's rowsum,
+# with the per-qubit ±1 phase terms counted by popcount
+def _product_sign(x1, z1, r1, x2, z2, r2):
+    y1, xo1, zo1 = x1 & z1, x1 & ~z1, z1 & ~x1
+    y2, xo2, zo2 = x2 & z2, x2 & ~z2, z2 & ~x2
+    plus = ((y1 & zo2) | (xo1 & y2) | (zo1 & xo2)).bit_count()
+    minus = ((y1 & xo2) | (xo1 & zo2) | (zo1 & y2)).bit_count()
+    return (2*r1 + 2*r2 + plus - minus) % 4 == 2
+
+# Support of the state: a particular outcome x0 and a basis G of the subspace.
+# Stabilizers are reduced against an echelon basis of their X parts; those that
+# reduce to a ±Z-string fix a parity z·x0 = r of every outcome.
+def support(qc):
+    n = qc.num_qubits
+    x, z, r = tableau(qc)
+    basis, constraints = {}, []              # leading bit -> (x, z, r)
+    for xr, zr, rr in zip(_row_ints(x), _row_ints(z), r.tolist()):
+        while xr:
+            lead = xr.bit_length() - 1
+            if lead not in basis:
+                basis[lead] = (xr, zr, rr)
+                break
+            bx, bz, br = basis[lead]
+            rr = _product_sign(bx, bz, br, xr, zr, rr)
+            xr, zr = xr ^ bx, zr ^ bz
+        else:
+            constraints.append((zr, rr))
+    pivots = {}                               # the same echelon trick for z·x0 = r
+    for zr, rr in constraints:
+        while zr:
+            lead = zr.bit_length() - 1
+            if lead not in pivots:
+                pivots[lead] = (zr, rr)
+                break
+            pz, pr = pivots[lead]
+            zr, rr = zr ^ pz, rr ^ pr
+    x0 = 0
+    for lead in sorted(pivots):              # lower bits are already decided
+        zr, rr = pivots[lead]
+        if rr ^ ((zr & x0).bit_count() & 1):
+            x0 |= 1 << lead
+    return _int_bits([x0], n)[0], _int_bits([basis[k][0] for k in sorted(basis)], n)
+
+def sample_clifford(qc, shots, seed=None):
+    x0, G = support(qc)
+    rng = np.random.default_rng(seed)
+    coeffs = rng.integers(0, 2, (shots, len(G)), dtype=np.uint8)
+    flips = (coeffs.astype(np.float32) @ G.astype(np.float32)).astype(np.int64) & 1
+    return (flips ^ x0).astype(np.uint8)
+
+# Drops measurements (assumed final) without remove_final_measurements' DAG pass.
+# The copy has no classical bits, so measure_all's register is the only one
+# and Aer's memory strings carry no register separators.
+def _unmeasured(qc):
+    out = QuantumCircuit(qc.qubits, global_phase=qc.global_phase)
+    for inst in qc.data:
+        if inst.operation.name != "measure":
+            out.append(inst)
+    return out
+
+def sample_bits(qc, shots, seed=None):
+    if is_clifford(qc):
+        return sample_clifford(qc, shots, seed)
+    qc = _unmeasured(qc)
+    qc.measure_all()
+    memory = AerSimulator().run(qc, shots=shots, memory=True, seed_simulator=seed).result().get_memory()
+    bits = np.frombuffer("".join(memory).encode(), dtype=np.uint8).reshape(shots, -1) - ord("0")
+    return bits[:, ::-1]
+
+# (pauli, coefficient, index of the operator it belongs to) for every term
+def _terms(operators):
+    for i, op in enumerate(operators):
+        if isinstance(op, SparsePauliOp):
+            for p, c in zip(op.paulis, op.coeffs):
+                yield p, complex(c), i
+        else:
+            p = Pauli(op)
+            yield p, 1.0, i
+
+# Greedy qubit-wise commuting groups; a basis entry is 0 (free), 1 X, 2 Y or 3 Z
+def _groups(paulis, n):
+    groups = []                                  # [basis, [term indices]]
+    for t, p in enumerate(paulis):
+        letters = p.x.astype(np.int8) + 2*p.z.astype(np.int8)
+        letters = np.where(letters == 3, 2, np.where(letters == 2, 3, letters))
+        for basis, members in groups:
+            if np.all((letters == 0) | (basis == 0) | (letters == basis)):
+                np.maximum(basis, letters, out=basis)
+                members.append(t)
+                break
+        else:
+            groups.append([letters.copy(), [t]])
+    return groups
+
+def estimate_paulis(qc, operators, shots=4096, seed=None):
+    qc = _unmeasured(qc)
+    n = qc.num_qubits
+    terms = list(_terms(operators))
+    paulis = [p for p, _, _ in terms]
+    rng = np.random.default_rng(seed)
+    values = np.zeros(len(operators), dtype=complex)
+    for basis, members in _groups(paulis, n):
+        rotated = qc.copy()
+        for q in np.flatnonzero(basis == 2):
+            rotated.sdg(int(q))
+        for q in np.flatnonzero((basis == 1) | (basis == 2)):
+            rotated.h(int(q))
+        bits = sample_bits(rotated, shots, int(rng.integers(2**32))).astype(np.float32)
+        masks = np.array([paulis[t].x | paulis[t].z for t in members], dtype=np.float32)
+        parity = (bits @ masks.T).astype(np.int64) & 1           # shots × terms
+        evs = 1 - 2*parity.mean(axis=0)
+        for t, ev in zip(members, evs):
+            p, coeff, i = terms[t]
+            values[i] += coeff * (-1j)**p.phase * ev
+    return values.real if np.allclose(values.imag, 0) else values
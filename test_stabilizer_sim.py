@@ -0,0 +1,19 @@
+import numpy as np
+from qiskit import QuantumCircuit
+from stabilizer_sim import sample_bits
+
+def test_non_clifford_with_classical_register():
+    qc = QuantumCircuit(2, 2)
+    qc.h(0); qc.t(0); qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+    bits = sample_bits(qc, 200, seed=1)
+    assert bits.shape == (200, 2)
+    assert set(np.unique(bits)) <= {0, 1}
+    assert np.array_equal(bits[:, 0], bits[:, 1])          # Bell pair: qubits agree
+    assert 0 < bits[:, 0].mean() < 1
+
+def test_non_clifford_bit_order():
+    qc = QuantumCircuit(3, 3)
+    qc.x(0); qc.t(1)
+    qc.measure(range(3), range(3))
+    assert (sample_bits(qc, 20, seed=0) == [1, 0, 0]).all()
@@ -0,0 +1,100 @@
+# tfim.py  –  parameterised Trotter circuits for the 1D transverse-field Ising model
+#
+#   tfim = TFIMTemplate(num_qubits=12)
+#   mz = tfim.sweep(steps=range(1, 11), angles=np.linspace(0, np.pi/2, 50))   # (10, 50)
+#
+# The transverse field enters only through rx_angle, so each step count is one
+# circuit with a symbolic Parameter, and a whole (steps × angles) phase diagram
+# is one Estimator call: a PUB per step count, binding every angle at once.
+# Without a backend a single Trotter layer is transpiled once and step s is
+# step s-1 plus that layer; with one, each step count is compiled once for it.
+
+import numpy as np
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter
+from qiskit.quantum_info import SparsePauliOp
+from qiskit.primitives import StatevectorEstimator, StatevectorSampler
+
+BASIS = ["rz", "sx", "x", "cx"]
+
+# Rzz(-π/2) as sdg·sdg, then √Y, CX, √Y† on the second qubit; √Y is RY(π/2)
+# up to a global phase, which keeps the layer in native rotations.
+def add_1d_tfim_trotter_layer(qc, rx_angle):
+    # Adding Rzz in the even layers
+    for i in range(0, qc.num_qubits-1, 2):
+        qc.sdg([i, i+1])
+        qc.ry(np.pi/2, i+1)
+        qc.cx(i, i+1)
+        qc.ry(-np.pi/2, i+1)
+    # Adding Rzz in the odd layers
+    for i in range(1, qc.num_qubits-1, 2):
+        qc.sdg([i, i+1])
+        qc.ry(np.pi/2, i+1)
+        qc.cx(i, i+1)
+        qc.ry(-np.pi/2, i+1)
+    qc.rx(rx_angle, list(range(qc.num_qubits)))
+
+def generate_1d_tfim_circuit(num_qubits, num_trotter_steps, rx_angle):
+    qc = QuantumCircuit(num_qubits)
+
+    for trotter_step in range(num_trotter_steps):
+        add_1d_tfim_trotter_layer(qc, rx_angle)
+
+    return qc
+
+# Average Z magnetisation, (1/n)·Σ Z_i
+def magnetization(num_qubits):
+    return SparsePauliOp.from_sparse_list([("Z", [i], 1/num_qubits) for i in range(num_qubits)],
+                                          num_qubits)
+
+class TFIMTemplate:
+    def __init__(self, num_qubits, backend=None):
+        self.num_qubits, self.backend = num_qubits, backend
+        self.rx_angle = Parameter("rx_angle")
+        layer = QuantumCircuit(num_qubits)
+        add_1d_tfim_trotter_layer(layer, self.rx_angle)
+        self._layer = layer if backend else transpile(layer, basis_gates=BASIS)
+        self._circuits = [QuantumCircuit(num_qubits)]   # by step count, grown one layer at a time
+        self._compiled = {}                             # step count -> backend circuit
+
+    def extend(self):
+        self._circuits.append(self._circuits[-1].compose(self._layer))
+        return self._circuits[-1]
+
+    def circuit(self, steps):
+        while len(self._circuits) <= steps:
+            self.extend()
+        if self.backend is None:
+            return self._circuits[steps]
+        if steps not in self._compiled:
+            self._compiled[steps] = transpile(self._circuits[steps], self.backend)
+        return self._compiled[steps]
+
+    def _observable(self, circuit, observable):
+        return observable if circuit.layout is None else observable.apply_layout(circuit.layout)
+
+    # Expectation values, shape (len(steps), len(angles)) for one observable or
+    # (len(steps), len(angles), K) for a list of K; default is magnetization.
+    def sweep(self, steps, angles, observables=None, estimator=None, precision=None):
+        observables = magnetization(self.num_qubits) if observables is None else observables
+        single = isinstance(observables, SparsePauliOp)
+        obs = [observables] if single else list(observables)
+        values = np.asarray(angles, dtype=float).reshape(-1, 1, 1)    # angles × observables
+        pubs = []
+        for s in steps:
+            circuit = self.circuit(s)
+            pubs.append((circuit, [[self._observable(circuit, o) for o in obs]], values))
+        estimator = estimator or StatevectorEstimator()
+        result = estimator.run(pubs, precision=precision).result()
+        evs = np.array([pub.data.evs.reshape(len(values), len(obs)) for pub in result])
+        return evs[..., 0] if single else evs
+
+    # Bitstring samples for every (step count, angle): one Sampler call
+    def sample(self, steps, angles, shots=1024, sampler=None):
+        pubs = []
+        for s in steps:
+            circuit = self.circuit(s).copy()
+            circuit.measure_all()
+            pubs.append((circuit, np.asarray(angles, dtype=float).reshape(-1, 1)))
+        sampler = sampler or StatevectorSampler()
+        return sampler.run(pubs, shots=shots).result()
@@ -0,0 +1,161 @@
+# tfim_mps.py  –  matrix-product-state engine for long nearest-neighbour chains
+#
+#   mps = run_mps(generate_1d_tfim_circuit(300, 10, 0.3), max_bond=64)
+#   mps.expect(Z, range(300)), mps.two_point(Z, 150, Z, range(151, 300))
+#   mps.truncation_error, mps.bond_dims()
+#   mps_sweep(300, range(1, 11), angles, max_bond=64)   # like TFIMTemplate.sweep
+#
+# add_1d_tfim_trotter_layer only couples neighbours on a line, so the state is
+# kept as one rank-3 tensor per site instead of 2^n amplitudes: memory is
+# O(n·χ²) for a bond-dimension cap χ, which puts 100–500-site chains at
+# moderate depth on one CPU.  The MPS is kept in mixed canonical form, so each
+# two-qubit gate is one SVD at the orthogonality centre and the squared
+# singular values it drops are the exact loss of norm; truncation_error sums
+# them over the run (an upper bound on 1 − fidelity to first order).
+#
+# Any circuit of one-qubit gates and two-qubit gates on adjacent qubits runs;
+# anything wider or longer-range raises ValueError.
+
+import numpy as np
+from qiskit import QuantumCircuit
+from tfim import add_1d_tfim_trotter_layer
+
+Z = np.diag([1.0, -1.0])
+X = np.array([[0.0, 1.0], [1.0, 0.0]])
+
+class MPS:
+    def __init__(self, num_qubits, max_bond=64, cutoff=1e-12):
+        self.num_qubits, self.max_bond, self.cutoff = num_qubits, max_bond, cutoff
+        self.tensors = [np.array([1.0, 0.0], dtype=complex).reshape(1, 2, 1)
+                        for _ in range(num_qubits)]        # |0…0>, (left, phys, right)
+        self.center = 0
+        self.truncation_error = 0.0
+
+    def bond_dims(self):
+        return [A.shape[2] for A in self.tensors[:-1]]
+
+    def nbytes(self):
+        return sum(A.nbytes for A in self.tensors)
+
+    # QR sweeps move the orthogonality centre without changing the state
+    def move_center(self, site):
+        T = self.tensors
+        while self.center < site:
+            c = self.center
+            Dl, _, Dr = T[c].shape
+            Q, R = np.linalg.qr(T[c].reshape(Dl*2, Dr))
+            T[c] = Q.reshape(Dl, 2, -1)
+            T[c+1] = np.tensordot(R, T[c+1], axes=(1, 0))
+            self.center += 1
+        while self.center > site:
+            c = self.center
+            Dl, _, Dr = T[c].shape
+            Q, R = np.linalg.qr(T[c].reshape(Dl, 2*Dr).T)
+            T[c] = Q.T.reshape(-1, 2, Dr)
+            T[c-1] = np.tensordot(T[c-1], R.T, axes=(2, 0))
+            self.center -= 1
+
+    def apply_1q(self, U, site):
+        self.tensors[site] = np.einsum("op,lpr->lor", U, self.tensors[site])
+
+    # U indexed [out_i, out_i+1, in_i, in_i+1]
+    def apply_2q(self, U, site):
+        self.move_center(site)
+        A, B = self.tensors[site], self.tensors[site+1]
+        theta = np.tensordot(np.tensordot(A, B, axes=(2, 0)), U, axes=([1, 2], [2, 3]))
+        theta = theta.transpose(0, 2, 3, 1)                    # (left, i, i+1, right)
+        Dl, _, _, Dr = theta.shape
+        u, s, vh = np.linalg.svd(theta.reshape(Dl*2, 2*Dr), full_matrices=False)
+        norm2 = np.sum(s**2)
+        keep = max(1, min(self.max_bond, int(np.sum(s > self.cutoff * s[0]))))
+        self.truncation_error += float(np.sum(s[keep:]**2) / norm2)
+        s = s[:keep] / np.sqrt(np.sum(s[:keep]**2) / norm2)
+        self.tensors[site] = u[:, :keep].reshape(Dl, 2, keep)
+        self.tensors[site+1] = (s[:, None] * vh[:keep]).reshape(keep, 2, Dr)
+        self.center = site + 1
+
+    def apply(self, U, qubits):
+        if len(qubits) == 1:
+            self.apply_1q(U, qubits[0])
+        else:
+            self.apply_2q(U, min(qubits))
+
+    def apply_circuit(self, qc):
+        for U, qubits in gate_list(qc):
+            self.apply(U, qubits)
+        return self
+
+    # <op> on each site, real part (op Hermitian)
+    def expect(self, op, sites):
+        out = []
+        for site in sites:
+            self.move_center(site)
+            A = self.tensors[site]
+            out.append(np.einsum("lpr,pq,lqr->", A.conj(), op, A).real)
+        return np.array(out)
+
+    # <op_a(i) op_b(j)> for every j > i in one left-to-right pass
+    def two_point(self, op_a, i, op_b, js):
+        js = sorted(js)
+        self.move_center(i)
+        A = self.tensors[i]
+        env = np.einsum("lpr,pq,lqs->rs", A.conj(), op_a, A)   # sites > i right-canonical
+        out, k = {}, i + 1
+        for j in js:
+            while k < j:
+                A = self.tensors[k]
+                env = np.einsum("rs,rpt,spu->tu", env, A.conj(), A, optimize=True)
+                k += 1
+            A = self.tensors[j]
+            out[j] = np.einsum("rs,rpt,pq,sqt->", env, A.conj(), op_b, A, optimize=True).real
+        return np.array([out[j] for j in js])
+
+# (matrix, qubits) per gate, two-qubit matrices already as [out_i, out_i+1, in_i,
+# in_i+1].  One-qubit gates are folded into the next two-qubit gate on their
+# qubit, so a Trotter layer is one contraction per bond (and rx per site); it
+# is converted once and replayed every step.
+def gate_list(qc):
+    gates, pending = [], {}            # qubit -> product of one-qubit gates not yet applied
+    for inst in qc.data:
+        op, qubits = inst.operation, [qc.find_bit(q).index for q in inst.qubits]
+        if op.name in ("barrier", "measure"):
+            continue
+        U = op.to_matrix()
+        if len(qubits) == 1:
+            pending[qubits[0]] = U @ pending.get(qubits[0], np.eye(2))
+            continue
+        if len(qubits) != 2 or abs(qubits[0] - qubits[1]) != 1:
+            raise ValueError(f"{op.name} on qubits {qubits} is not nearest-neighbour")
+        # Qiskit orders a two-qubit matrix as |q1 q0>, q0 the first argument
+        U = U.reshape(2, 2, 2, 2)
+        if qubits[0] < qubits[1]:
+            U = U.transpose(1, 0, 3, 2)
+        i = min(qubits)
+        U = np.einsum("ijpq,pa,qb->ijab", U, pending.pop(i, np.eye(2)),
+                      pending.pop(i+1, np.eye(2)))
+        gates.append((U, [i, i+1]))
+    gates += [(U, [q]) for q, U in sorted(pending.items())]
+    return gates
+
+def run_mps(qc, max_bond=64, cutoff=1e-12):
+    return MPS(qc.num_qubits, max_bond, cutoff).apply_circuit(qc)
+
+# Magnetisation and accumulated truncation error, each (len(steps), len(angles)).
+# One pass per angle: the state grows layer by layer and is read at each step.
+def mps_sweep(num_qubits, steps, angles, max_bond=64, cutoff=1e-12):
+    steps = sorted(steps)
+    mz = np.zeros((len(steps), len(angles)))
+    err = np.zeros_like(mz)
+    for a, angle in enumerate(angles):
+        mps = MPS(num_qubits, max_bond, cutoff)
+        layer = QuantumCircuit(num_qubits)
+        add_1d_tfim_trotter_layer(layer, float(angle))
+        layer, done = gate_list(layer), 0
+        for s_idx, s in enumerate(steps):
+            for _ in range(s - done):
+                for U, qubits in layer:
+                    mps.apply(U, qubits)
+            done = s
+            mz[s_idx, a] = mps.expect(Z, range(num_qubits)).mean()
+            err[s_idx, a] = mps.truncation_error
+    return mz, err